@@ -16,7 +16,8 @@ tags: [example, demo, tutorial]
 """
 
 import logging
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Sequence
 
 from extension_framework import (
     UIExtension,
@@ -33,21 +34,15 @@ logger = logging.getLogger("example_extension")
 class ExampleExtension(UIExtension):
     """A simple example extension."""
     
-    @property
-    def name(self) -> str:
-        return "example-extension"
-    
-    @property
-    def version(self) -> str:
-        return "0.1.0"
+    _MOUNT_POINTS: Mapping[str, Sequence[str]] = MappingProxyType({
+        "sidebar": ("example_greeting",),
+        "chat": ("example_helper",),
+    })
     
-    @property
-    def description(self) -> str:
-        return "A simple example extension to demonstrate how to build extensions."
-    
-    @property
-    def author(self) -> str:
-        return "Open WebUI Team"
+    name = "example-extension"
+    version = "0.1.0"
+    description = "A simple example extension to demonstrate how to build extensions."
+    author = "Open WebUI Team"
     
     @property
     def components(self) -> Dict[str, Any]:
@@ -55,11 +50,8 @@ class ExampleExtension(UIExtension):
         return get_components()
     
     @property
-    def mount_points(self) -> Dict[str, List[str]]:
-        return {
-            "sidebar": ["example_greeting"],
-            "chat": ["example_helper"],
-        }
+    def mount_points(self) -> Mapping[str, Sequence[str]]:
+        return self._MOUNT_POINTS
     
     def initialize(self, context: Dict[str, Any]) -> bool:
         """Initialize the extension."""
@@ -88,12 +80,13 @@ class ExampleExtension(UIExtension):
     @hook("ui_chat")
     def on_ui_chat(self, chat_id: str) -> None:
         """Hook called when the chat interface is rendered."""
-        logger.info(f"Chat interface rendered: {chat_id}")
+        logger.info("Chat interface rendered: %s", chat_id)
     
     @hook("model_before_generate", priority=5)
     def on_model_before_generate(self, prompt: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Hook called before generating text."""
-        logger.info(f"Generating text with prompt: {prompt[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generating text with prompt: %s...", prompt[:50])
         # You can modify the prompt or parameters here
         return params
 
@@ -2,13 +2,34 @@
 API endpoints for the example extension.
 """
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 from fastapi import APIRouter, HTTPException
 
 from extension_framework import api_route
+from extension_framework.serialization import default_response_class
 
 # Create API router
-router = APIRouter(prefix="/api/example", tags=["example"])
+router = APIRouter(prefix="/api/example", tags=["example"], default_response_class=default_response_class())
+
+# Mock weather data for demonstration purposes, keyed by case-folded location
+_WEATHER: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "new york": {
+        "temperature": 72,
+        "conditions": "Sunny",
+        "humidity": 45,
+    },
+    "london": {
+        "temperature": 62,
+        "conditions": "Cloudy",
+        "humidity": 80,
+    },
+    "tokyo": {
+        "temperature": 85,
+        "conditions": "Partly Cloudy",
+        "humidity": 60,
+    },
+})
 
 @api_route("/greeting", methods=["GET"], summary="Get the example greeting")
 async def get_greeting(extension) -> Dict[str, Any]:
@@ -31,34 +52,15 @@ async def echo(extension, body: Dict[str, Any]) -> Dict[str, Any]:
 @api_route("/weather/{location}", methods=["GET"], summary="Get mock weather for a location")
 async def get_weather(extension, location: str) -> Dict[str, Any]:
     """Get mock weather for a location."""
-    # This is just a mock API for demonstration purposes
-    weather_data = {
-        "new york": {
-            "temperature": 72,
-            "conditions": "Sunny",
-            "humidity": 45,
-        },
-        "london": {
-            "temperature": 62,
-            "conditions": "Cloudy",
-            "humidity": 80,
-        },
-        "tokyo": {
-            "temperature": 85,
-            "conditions": "Partly Cloudy",
-            "humidity": 60,
-        },
-    }
-    
-    location_lower = location.lower()
-    if location_lower in weather_data:
-        return {
-            "location": location,
-            "weather": weather_data[location_lower],
-            "powered_by": f"{extension.name} v{extension.version}",
-        }
-    else:
+    weather = _WEATHER.get(location.casefold())
+    if weather is None:
         raise HTTPException(status_code=404, detail=f"Weather data not found for {location}")
+    
+    return {
+        "location": location,
+        "weather": weather,
+        "powered_by": f"{extension.name} v{extension.version}",
+    }
 
 def get_router() -> APIRouter:
     """Get the API router for the extension."""
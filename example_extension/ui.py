@@ -2,29 +2,20 @@
 UI components for the example extension.
 """
 
+import html
+from functools import lru_cache
 from typing import Dict, Any, List
 
 from extension_framework import ui_component
 
-@ui_component("example_greeting", mount_points=["sidebar"])
-def render_greeting(extension) -> Dict[str, Any]:
-    """Render a greeting in the sidebar."""
-    if not extension.show_greeting:
-        return {"html": ""}
-    
-    return {
-        "html": f"""
-        <div class="example-extension-greeting" style="color: {extension.greeting_color}; padding: 1rem; text-align: center; font-weight: bold;">
-            {extension.greeting_text}
+_GREETING_TEMPLATE = """
+        <div class="example-extension-greeting" style="color: {color}; padding: 1rem; text-align: center; font-weight: bold;">
+            {text}
         </div>
         """
-    }
 
-@ui_component("example_helper", mount_points=["chat"])
-def render_helper(extension) -> Dict[str, Any]:
-    """Render a helper in the chat interface."""
-    return {
-        "html": f"""
+# The helper markup never changes, so it is built once at import time
+_HELPER_HTML = """
         <div class="example-extension-helper" style="margin: 0.5rem 0; padding: 0.5rem; background-color: #f8f9fa; border-radius: 0.25rem; font-size: 0.875rem;">
             <div style="display: flex; align-items: center; gap: 0.5rem;">
                 <div style="font-weight: bold;">Example Extension Helper</div>
@@ -48,6 +39,27 @@ def render_helper(extension) -> Dict[str, Any]:
             });
         </script>
         """
+
+@lru_cache(maxsize=16)
+def _render_greeting_html(color: str, text: str) -> str:
+    """Render the greeting markup for a given color and text."""
+    return _GREETING_TEMPLATE.format(color=html.escape(color), text=html.escape(text))
+
+@ui_component("example_greeting", mount_points=["sidebar"])
+def render_greeting(extension) -> Dict[str, Any]:
+    """Render a greeting in the sidebar."""
+    if not extension.show_greeting:
+        return {"html": ""}
+    
+    return {
+        "html": _render_greeting_html(str(extension.greeting_color), str(extension.greeting_text))
+    }
+
+@ui_component("example_helper", mount_points=["chat"])
+def render_helper(extension) -> Dict[str, Any]:
+    """Render a helper in the chat interface."""
+    return {
+        "html": _HELPER_HTML
     }
 
 def get_components() -> Dict[str, Any]:
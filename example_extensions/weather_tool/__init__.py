@@ -2,6 +2,15 @@ from open_webui_extensions.extension_system.base import ToolExtension
 from open_webui_extensions.extension_system.decorators import tool, startup_hook
 import random
 
+# Weather data (simulated), keyed by case-folded location
+_WEATHER_TOOL = {
+    "new york": {"temperature": 72, "condition": "Sunny"},
+    "london": {"temperature": 65, "condition": "Cloudy"},
+    "tokyo": {"temperature": 78, "condition": "Partly Cloudy"},
+    "sydney": {"temperature": 80, "condition": "Clear"},
+    "paris": {"temperature": 70, "condition": "Rainy"},
+}
+
 class WeatherToolExtension(ToolExtension):
     """An example tool extension that provides weather information."""
     
@@ -13,13 +22,7 @@ class WeatherToolExtension(ToolExtension):
     author = "Open WebUI Team"
     
     # Weather data (simulated)
-    weather_data = {
-        "New York": {"temperature": 72, "condition": "Sunny"},
-        "London": {"temperature": 65, "condition": "Cloudy"},
-        "Tokyo": {"temperature": 78, "condition": "Partly Cloudy"},
-        "Sydney": {"temperature": 80, "condition": "Clear"},
-        "Paris": {"temperature": 70, "condition": "Rainy"},
-    }
+    weather_data = _WEATHER_TOOL
     
     @startup_hook
     async def on_startup(self):
@@ -37,8 +40,9 @@ class WeatherToolExtension(ToolExtension):
     def get_weather(self, location: str):
         """Get the current weather for a location."""
         # If the location exists in our data, return it
-        if location in self.weather_data:
-            return self.weather_data[location]
+        weather = self.weather_data.get(location.casefold())
+        if weather is not None:
+            return weather
         
         # Otherwise, generate some random weather
         return {
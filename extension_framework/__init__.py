@@ -39,22 +39,35 @@ from .decorators import (
     collect_components_from_instance,
     collect_routes_from_instance,
     collect_tools_from_instance,
+    collect_all_from_instance,
     collect_settings_from_class,
+    InstanceMembers,
 )
 
 from .utils import (
     load_extension,
     discover_extensions,
+    clear_discovery_cache,
     load_extension_config,
     save_extension_config,
     install_extension_from_zip,
     install_extension_from_url,
+    install_extension_from_url_async,
     install_extension_from_directory,
     uninstall_extension,
+    extract_archive,
+    ArchiveTooLargeError,
+    DependencyGraph,
     resolve_extension_dependencies,
     sort_extensions_by_dependencies,
 )
 
+from .serialization import (
+    json_loads,
+    json_dumps,
+    default_response_class,
+)
+
 __all__ = [
     # Base classes
     "Extension",
@@ -83,19 +96,31 @@ __all__ = [
     "collect_components_from_instance",
     "collect_routes_from_instance",
     "collect_tools_from_instance",
+    "collect_all_from_instance",
     "collect_settings_from_class",
+    "InstanceMembers",
     
     # Utilities
     "load_extension",
     "discover_extensions",
+    "clear_discovery_cache",
     "load_extension_config",
     "save_extension_config",
     "install_extension_from_zip",
     "install_extension_from_url",
+    "install_extension_from_url_async",
     "install_extension_from_directory",
     "uninstall_extension",
+    "extract_archive",
+    "ArchiveTooLargeError",
+    "DependencyGraph",
     "resolve_extension_dependencies",
     "sort_extensions_by_dependencies",
+    
+    # Serialization
+    "json_loads",
+    "json_dumps",
+    "default_response_class",
 ]
 
 __version__ = "0.1.0"
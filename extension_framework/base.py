@@ -11,42 +11,48 @@ import logging
 logger = logging.getLogger("extension_framework")
 
 class Extension(ABC):
-    """Base class for all extensions."""
+    """Base class for all extensions.
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """The name of the extension."""
-        pass
+    Concrete subclasses must set the ``name``, ``version``, ``description``
+    and ``author`` class attributes.
+    """
     
-    @property
-    @abstractmethod
-    def version(self) -> str:
-        """The version of the extension."""
-        pass
+    # Required metadata, set as plain class attributes by concrete subclasses
+    name: str
+    version: str
+    description: str
+    author: str
     
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """A description of what the extension does."""
-        pass
+    # The type of extension (UI, API, Model, Tool, Theme)
+    type: str = "generic"
     
-    @property
-    @abstractmethod
-    def author(self) -> str:
-        """The author(s) of the extension."""
-        pass
+    _REQUIRED_METADATA = ("name", "version", "description", "author")
+    _missing_metadata: tuple = _REQUIRED_METADATA
+    
+    # Settings registered with the @setting decorator
+    _settings_info: tuple = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Give each subclass its own settings tuple, starting from the inherited ones
+        cls._settings_info = tuple(cls._settings_info)
+        cls._missing_metadata = tuple(
+            attr for attr in cls._REQUIRED_METADATA if not hasattr(cls, attr)
+        )
+    
+    def __new__(cls, *args, **kwargs):
+        if cls._missing_metadata:
+            raise TypeError(
+                f"Can't instantiate extension class {cls.__name__} "
+                f"without metadata: {', '.join(cls._missing_metadata)}"
+            )
+        return super().__new__(cls)
     
     @property
     def dependencies(self) -> List[str]:
         """List of other extensions this extension depends on."""
         return []
     
-    @property
-    def type(self) -> str:
-        """The type of extension (UI, API, Model, Tool, Theme)."""
-        return "generic"
-    
     @property
     def settings(self) -> Dict[str, Any]:
         """The extension's default settings."""
@@ -101,9 +107,7 @@ class Extension(ABC):
 class UIExtension(Extension):
     """Base class for UI extensions."""
     
-    @property
-    def type(self) -> str:
-        return "ui"
+    type = "ui"
     
     @property
     @abstractmethod
@@ -119,9 +123,7 @@ class UIExtension(Extension):
 class APIExtension(Extension):
     """Base class for API extensions."""
     
-    @property
-    def type(self) -> str:
-        return "api"
+    type = "api"
     
     @property
     @abstractmethod
@@ -132,9 +134,7 @@ class APIExtension(Extension):
 class ModelAdapter(Extension):
     """Base class for model adapter extensions."""
     
-    @property
-    def type(self) -> str:
-        return "model"
+    type = "model"
     
     @abstractmethod
     def load_model(self) -> Any:
@@ -157,9 +157,7 @@ class ModelAdapter(Extension):
 class ToolExtension(Extension):
     """Base class for tool extensions."""
     
-    @property
-    def type(self) -> str:
-        return "tool"
+    type = "tool"
     
     @property
     @abstractmethod
@@ -170,9 +168,7 @@ class ToolExtension(Extension):
 class ThemeExtension(Extension):
     """Base class for theme extensions."""
     
-    @property
-    def type(self) -> str:
-        return "theme"
+    type = "theme"
     
     @property
     @abstractmethod
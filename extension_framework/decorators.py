@@ -2,12 +2,32 @@
 Decorators for Open WebUI extensions.
 """
 
-from typing import Callable, Any, Dict, List, Optional, Type, Union
-from functools import wraps
+from typing import Callable, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+from dataclasses import dataclass, field
+from weakref import WeakKeyDictionary
 import inspect
 
 from .hooks import register_callback
 
+# Attributes the method decorators attach to the functions they mark
+_METHOD_MARKERS = ("_hook_info", "_component_info", "_route_info", "_tool_info")
+
+# Per-class cache of marked method names, keyed weakly so classes can be unloaded
+_marked_methods_cache: "WeakKeyDictionary[type, Dict[str, Tuple[str, ...]]]" = WeakKeyDictionary()
+
+class RouteInfo(NamedTuple):
+    """Route information attached to a function by the api_route decorator.
+    
+    The collect functions still return routes as dictionaries, with the
+    endpoint added; methods and tags stay tuples.
+    """
+    
+    path: str
+    methods: Tuple[str, ...]
+    tags: Tuple[str, ...]
+    summary: Optional[str]
+    response_model: Optional[Type]
+
 def hook(hook_name: str, priority: int = 10):
     """Decorator to register a function as a hook callback.
     
@@ -28,11 +48,7 @@ def hook(hook_name: str, priority: int = 10):
             "priority": priority,
         })
         
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        return wrapper
+        return func
     
     return decorator
 
@@ -54,11 +70,7 @@ def ui_component(component_id: str, mount_points: List[str] = None):
         func._component_info["id"] = component_id
         func._component_info["mount_points"] = mount_points or []
         
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        return wrapper
+        return func
     
     return decorator
 
@@ -75,22 +87,20 @@ def api_route(path: str, methods: List[str] = None, tags: List[str] = None, summ
     Returns:
         A decorator function.
     """
+    # Build the route information once, when the decorator is created
+    route_info = RouteInfo(
+        path=path,
+        methods=tuple(methods or ("GET",)),
+        tags=tuple(tags or ()),
+        summary=summary,
+        response_model=response_model,
+    )
+    
     def decorator(func: Callable) -> Callable:
         # Store the route information in the function
-        if not hasattr(func, "_route_info"):
-            func._route_info = {}
-        
-        func._route_info["path"] = path
-        func._route_info["methods"] = methods or ["GET"]
-        func._route_info["tags"] = tags or []
-        func._route_info["summary"] = summary
-        func._route_info["response_model"] = response_model
-        
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+        func._route_info = route_info
         
-        return wrapper
+        return func
     
     return decorator
 
@@ -112,11 +122,7 @@ def tool(name: str, description: str = None):
         func._tool_info["name"] = name
         func._tool_info["description"] = description or func.__doc__
         
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        return wrapper
+        return func
     
     return decorator
 
@@ -143,43 +149,123 @@ def setting(
     Returns:
         A decorator function.
     """
+    # Get the type from the default value if not provided
+    if type_ is not None:
+        inferred_type = type_
+    elif default is not None:
+        inferred_type = type(default)
+    else:
+        inferred_type = str
+    
+    # Build the setting entry once, when the decorator is created
+    setting_info = {
+        "name": name,
+        "default": default,
+        "type": inferred_type.__name__,
+        "description": description,
+        "options": options,
+        "required": required,
+        "category": category,
+    }
+    
     def decorator(cls: Type) -> Type:
-        # Store the setting information in the class
-        if not hasattr(cls, "_settings_info"):
-            cls._settings_info = []
-        
-        # Get the type from the default value if not provided
-        inferred_type = type_ or type(default) if default is not None else str
-        
-        cls._settings_info.append({
-            "name": name,
-            "default": default,
-            "type": inferred_type.__name__,
-            "description": description,
-            "options": options,
-            "required": required,
-            "category": category,
-        })
-        
+        # Store a new tuple on the class itself, so a parent's settings are never mutated
+        cls._settings_info = (*getattr(cls, "_settings_info", ()), setting_info)
         return cls
     
     return decorator
 
+def _get_marked_method_names(cls: Type) -> Dict[str, Tuple[str, ...]]:
+    """Get the names of the methods of a class that carry each decorator marker.
+    
+    The class hierarchy is walked once via the ``vars()`` of each class in the
+    MRO and the result is cached per class.
+    
+    Args:
+        cls: The class to inspect.
+        
+    Returns:
+        A dictionary mapping each marker attribute to a sorted tuple of method names.
+    """
+    cached = _marked_methods_cache.get(cls)
+    if cached is not None:
+        return cached
+    
+    marked = {marker: [] for marker in _METHOD_MARKERS}
+    seen = set()
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            # The first class in the MRO defining a name wins
+            if name in seen:
+                continue
+            seen.add(name)
+            
+            if not inspect.isfunction(value):
+                continue
+            
+            for marker in _METHOD_MARKERS:
+                if hasattr(value, marker):
+                    marked[marker].append(name)
+    
+    result = {marker: tuple(sorted(names)) for marker, names in marked.items()}
+    _marked_methods_cache[cls] = result
+    return result
+
+def _iter_marked_methods(instance: Any, marker: str) -> Iterator[Tuple[str, Callable]]:
+    """Iterate over the bound methods of an instance that carry a decorator marker.
+    
+    Args:
+        instance: The instance to inspect.
+        marker: The marker attribute, e.g. ``"_hook_info"``.
+        
+    Yields:
+        Tuples of the method name and the bound method.
+    """
+    for name in _get_marked_method_names(type(instance))[marker]:
+        yield name, getattr(instance, name)
+
+def _add_component(components: Dict[str, Dict[str, Any]], method: Callable) -> None:
+    component_info = method._component_info
+    components[component_info["id"]] = {
+        "render": method,
+        "mount_points": component_info["mount_points"],
+    }
+
+def _add_route(routes: List[Dict[str, Any]], method: Callable) -> None:
+    route = method._route_info._asdict()
+    route["endpoint"] = method
+    routes.append(route)
+
+def _add_tool(tools: Dict[str, Dict[str, Any]], method: Callable) -> None:
+    tool_info = method._tool_info
+    tools[tool_info["name"]] = {
+        "function": method,
+        "description": tool_info["description"],
+    }
+
+@dataclass
+class InstanceMembers:
+    """Everything the method decorators registered on an extension instance."""
+    
+    hooks: List[Tuple[Dict[str, Any], Callable]] = field(default_factory=list)
+    components: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    routes: List[Dict[str, Any]] = field(default_factory=list)
+    tools: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
 def register_hooks_from_instance(instance: Any) -> None:
     """Register all hook callbacks from an instance.
     
     Args:
         instance: The instance to register hooks from.
     """
-    for name, method in inspect.getmembers(instance, inspect.ismethod):
-        if hasattr(method, "_hook_info"):
-            for hook_info in method._hook_info:
-                register_callback(
-                    hook_info["hook_name"],
-                    method,
-                    instance.name,
-                    hook_info["priority"]
-                )
+    for name, method in _iter_marked_methods(instance, "_hook_info"):
+        for hook_info in method._hook_info:
+            register_callback(
+                hook_info["hook_name"],
+                method,
+                instance.name,
+                hook_info["priority"]
+            )
 
 def collect_components_from_instance(instance: Any) -> Dict[str, Dict[str, Any]]:
     """Collect all UI components from an instance.
@@ -192,13 +278,8 @@ def collect_components_from_instance(instance: Any) -> Dict[str, Dict[str, Any]]
     """
     components = {}
     
-    for name, method in inspect.getmembers(instance, inspect.ismethod):
-        if hasattr(method, "_component_info"):
-            component_info = method._component_info
-            components[component_info["id"]] = {
-                "render": method,
-                "mount_points": component_info["mount_points"],
-            }
+    for name, method in _iter_marked_methods(instance, "_component_info"):
+        _add_component(components, method)
     
     return components
 
@@ -213,11 +294,8 @@ def collect_routes_from_instance(instance: Any) -> List[Dict[str, Any]]:
     """
     routes = []
     
-    for name, method in inspect.getmembers(instance, inspect.ismethod):
-        if hasattr(method, "_route_info"):
-            route_info = method._route_info.copy()
-            route_info["endpoint"] = method
-            routes.append(route_info)
+    for name, method in _iter_marked_methods(instance, "_route_info"):
+        _add_route(routes, method)
     
     return routes
 
@@ -232,25 +310,46 @@ def collect_tools_from_instance(instance: Any) -> Dict[str, Dict[str, Any]]:
     """
     tools = {}
     
-    for name, method in inspect.getmembers(instance, inspect.ismethod):
-        if hasattr(method, "_tool_info"):
-            tool_info = method._tool_info
-            tools[tool_info["name"]] = {
-                "function": method,
-                "description": tool_info["description"],
-            }
+    for name, method in _iter_marked_methods(instance, "_tool_info"):
+        _add_tool(tools, method)
     
     return tools
 
-def collect_settings_from_class(cls: Type) -> List[Dict[str, Any]]:
+def collect_all_from_instance(instance: Any) -> InstanceMembers:
+    """Collect hooks, UI components, API routes and tools from an instance in one pass.
+    
+    Each marked method is bound once, however many decorators it carries.
+    
+    Args:
+        instance: The instance to collect from.
+        
+    Returns:
+        The collected members. Hooks are (hook_info, method) pairs, ready to
+        pass to register_callback.
+    """
+    members = InstanceMembers()
+    marked = _get_marked_method_names(type(instance))
+    
+    for name in sorted(set().union(*marked.values())):
+        method = getattr(instance, name)
+        if hasattr(method, "_hook_info"):
+            members.hooks.extend((hook_info, method) for hook_info in method._hook_info)
+        if hasattr(method, "_component_info"):
+            _add_component(members.components, method)
+        if hasattr(method, "_route_info"):
+            _add_route(members.routes, method)
+        if hasattr(method, "_tool_info"):
+            _add_tool(members.tools, method)
+    
+    return members
+
+def collect_settings_from_class(cls: Type) -> Tuple[Dict[str, Any], ...]:
     """Collect all settings from a class.
     
     Args:
         cls: The class to collect settings from.
         
     Returns:
-        A list of setting information.
+        A tuple of setting information.
     """
-    if hasattr(cls, "_settings_info"):
-        return cls._settings_info
-    return []
+    return getattr(cls, "_settings_info", ())
@@ -2,22 +2,65 @@
 Hook system for Open WebUI extensions.
 """
 
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, List, Any, Callable, NamedTuple, Optional
+from bisect import bisect_right
 import logging
+import sys
 
 logger = logging.getLogger("extension_hooks")
 
+class CallbackEntry(NamedTuple):
+    """A callback registered for a hook.
+    
+    Callbacks are stored as these tuples, but get_callbacks() still returns
+    them as dictionaries with the same keys.
+    """
+    
+    callback: Callable
+    extension: str
+    priority: int
+
+# Pre-defined hooks for the extension system
+_DEFAULT_HOOKS = {
+    # UI hooks
+    "ui_init": "Called when the UI is initialized",
+    "ui_render": "Called when the UI is rendered",
+    "ui_sidebar": "Called when the sidebar is rendered",
+    "ui_header": "Called when the header is rendered",
+    "ui_footer": "Called when the footer is rendered",
+    "ui_chat": "Called when the chat interface is rendered",
+    "ui_settings": "Called when the settings page is rendered",
+    
+    # API hooks
+    "api_init": "Called when the API is initialized",
+    "api_register_routes": "Called when API routes are registered",
+    "api_before_request": "Called before processing an API request",
+    "api_after_request": "Called after processing an API request",
+    
+    # Model hooks
+    "model_init": "Called when a model is initialized",
+    "model_register": "Called when a model is registered",
+    "model_before_generate": "Called before generating text",
+    "model_after_generate": "Called after generating text",
+    
+    # System hooks
+    "system_init": "Called when the system is initialized",
+    "system_shutdown": "Called when the system is shut down",
+    "system_settings_load": "Called when system settings are loaded",
+    "system_settings_save": "Called when system settings are saved",
+}
+
 class HookRegistry:
     """Registry for extension hooks."""
     
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(HookRegistry, cls).__new__(cls)
-            cls._instance._hooks = {}
-            cls._instance._callbacks = {}
-        return cls._instance
+    def __init__(self):
+        self._hooks = {
+            name: {"description": description, "callbacks": []}
+            for name, description in _DEFAULT_HOOKS.items()
+        }
+        self._callbacks = {name: [] for name in _DEFAULT_HOOKS}
+        # Sorted priorities kept parallel to each hook's callback list
+        self._priorities = {name: [] for name in _DEFAULT_HOOKS}
     
     def register_hook(self, name: str, description: str = "") -> None:
         """Register a new hook.
@@ -26,6 +69,8 @@ class HookRegistry:
             name: The name of the hook.
             description: A description of the hook.
         """
+        # Interned names let dict lookups short-circuit on identity
+        name = sys.intern(name)
         if name in self._hooks:
             logger.warning(f"Hook {name} already registered. Overwriting.")
         
@@ -36,6 +81,7 @@ class HookRegistry:
         
         if name not in self._callbacks:
             self._callbacks[name] = []
+            self._priorities[name] = []
     
     def register_callback(self, hook_name: str, callback: Callable, extension_name: str, priority: int = 10) -> bool:
         """Register a callback for a hook.
@@ -49,19 +95,19 @@ class HookRegistry:
         Returns:
             True if the callback was registered successfully, False otherwise.
         """
+        hook_name = sys.intern(hook_name)
+        extension_name = sys.intern(extension_name)
         if hook_name not in self._hooks:
             logger.warning(f"Hook {hook_name} not registered. Registering now.")
             self.register_hook(hook_name)
         
-        callback_info = {
-            "callback": callback,
-            "extension": extension_name,
-            "priority": priority,
-        }
+        callback_info = CallbackEntry(callback, extension_name, priority)
         
-        self._callbacks[hook_name].append(callback_info)
-        # Sort callbacks by priority
-        self._callbacks[hook_name].sort(key=lambda x: x["priority"])
+        # Insert after any callbacks with the same priority, keeping the list sorted
+        priorities = self._priorities[hook_name]
+        index = bisect_right(priorities, priority)
+        priorities.insert(index, priority)
+        self._callbacks[hook_name].insert(index, callback_info)
         return True
     
     def unregister_callback(self, hook_name: str, extension_name: str) -> bool:
@@ -74,16 +120,22 @@ class HookRegistry:
         Returns:
             True if any callbacks were unregistered, False otherwise.
         """
-        if hook_name not in self._callbacks:
+        hook_name = sys.intern(hook_name)
+        extension_name = sys.intern(extension_name)
+        callbacks = self._callbacks.get(hook_name)
+        if not callbacks:
             return False
         
-        initial_count = len(self._callbacks[hook_name])
-        self._callbacks[hook_name] = [
-            cb for cb in self._callbacks[hook_name] 
-            if cb["extension"] != extension_name
-        ]
+        # Remove matches in place, scanning backwards so indices stay valid
+        priorities = self._priorities[hook_name]
+        removed = False
+        for index in range(len(callbacks) - 1, -1, -1):
+            if callbacks[index].extension == extension_name:
+                del callbacks[index]
+                del priorities[index]
+                removed = True
         
-        return len(self._callbacks[hook_name]) < initial_count
+        return removed
     
     def execute_hook(self, hook_name: str, *args, **kwargs) -> List[Any]:
         """Execute all callbacks for a hook.
@@ -96,6 +148,7 @@ class HookRegistry:
         Returns:
             A list of results from all callbacks.
         """
+        hook_name = sys.intern(hook_name)
         if hook_name not in self._callbacks:
             logger.warning(f"No callbacks registered for hook {hook_name}")
             return []
@@ -103,10 +156,10 @@ class HookRegistry:
         results = []
         for callback_info in self._callbacks[hook_name]:
             try:
-                result = callback_info["callback"](*args, **kwargs)
+                result = callback_info.callback(*args, **kwargs)
                 results.append(result)
             except Exception as e:
-                logger.error(f"Error executing callback for hook {hook_name} from extension {callback_info['extension']}: {e}")
+                logger.error(f"Error executing callback for hook {hook_name} from extension {callback_info.extension}: {e}")
         
         return results
     
@@ -128,45 +181,10 @@ class HookRegistry:
             A dictionary of callback information.
         """
         if hook_name is not None:
-            return {hook_name: self._callbacks.get(hook_name, [])}
-        return self._callbacks
-
-# Pre-defined hooks for the extension system
-def register_default_hooks():
-    """Register default hooks for the extension system."""
-    registry = HookRegistry()
-    
-    # UI hooks
-    registry.register_hook("ui_init", "Called when the UI is initialized")
-    registry.register_hook("ui_render", "Called when the UI is rendered")
-    registry.register_hook("ui_sidebar", "Called when the sidebar is rendered")
-    registry.register_hook("ui_header", "Called when the header is rendered")
-    registry.register_hook("ui_footer", "Called when the footer is rendered")
-    registry.register_hook("ui_chat", "Called when the chat interface is rendered")
-    registry.register_hook("ui_settings", "Called when the settings page is rendered")
-    
-    # API hooks
-    registry.register_hook("api_init", "Called when the API is initialized")
-    registry.register_hook("api_register_routes", "Called when API routes are registered")
-    registry.register_hook("api_before_request", "Called before processing an API request")
-    registry.register_hook("api_after_request", "Called after processing an API request")
-    
-    # Model hooks
-    registry.register_hook("model_init", "Called when a model is initialized")
-    registry.register_hook("model_register", "Called when a model is registered")
-    registry.register_hook("model_before_generate", "Called before generating text")
-    registry.register_hook("model_after_generate", "Called after generating text")
-    
-    # System hooks
-    registry.register_hook("system_init", "Called when the system is initialized")
-    registry.register_hook("system_shutdown", "Called when the system is shut down")
-    registry.register_hook("system_settings_load", "Called when system settings are loaded")
-    registry.register_hook("system_settings_save", "Called when system settings are saved")
-
-# Initialize default hooks
-register_default_hooks()
+            return {hook_name: [cb._asdict() for cb in self._callbacks.get(hook_name, [])]}
+        return {name: [cb._asdict() for cb in callbacks] for name, callbacks in self._callbacks.items()}
 
-# Singleton instance for easy access
+# Module-level registry shared by the whole extension system
 hook_registry = HookRegistry()
 
 def register_hook(name: str, description: str = "") -> None:
@@ -0,0 +1,69 @@
+"""
+JSON helpers shared by the framework and extensions.
+
+orjson is used when it is installed, with the standard library as the fallback.
+"""
+
+import datetime
+import json
+from enum import Enum
+from typing import Any, Type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson supports natively but the json module does not."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from bytes, a bytes-like object or a string.
+    
+    Args:
+        data: The JSON document.
+    
+    Returns:
+        The parsed value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode a value as UTF-8 JSON, indented by two spaces.
+    
+    Enums, datetimes and non-string dictionary keys are encoded the same way
+    with and without orjson.
+    
+    Args:
+        obj: The value to encode.
+    
+    Returns:
+        The encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, default=_default).encode("utf-8")
+
+def default_response_class() -> Type[Any]:
+    """Get the FastAPI response class for JSON endpoints.
+    
+    Returns:
+        ORJSONResponse when orjson is installed, JSONResponse otherwise.
+    """
+    if orjson is not None:
+        from fastapi.responses import ORJSONResponse
+        return ORJSONResponse
+    
+    from fastapi.responses import JSONResponse
+    return JSONResponse
@@ -4,27 +4,104 @@ Utility functions for Open WebUI extensions.
 
 import os
 import sys
+import asyncio
 import importlib.util
 import inspect
 import logging
-import yaml
-import json
-from typing import Dict, List, Any, Type, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Any, Type, Optional, Set, Tuple
 import hashlib
 import shutil
 import tempfile
-import zipfile
-import requests
+from collections import defaultdict, deque
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from .base import Extension
 from .decorators import register_hooks_from_instance
+from .serialization import json_dumps, json_loads
 
 logger = logging.getLogger("extension_utils")
 
+# PyYAML, requests and zipfile are only needed for YAML configs and installs,
+# so they are imported on first use rather than with this module
+
+@lru_cache(maxsize=None)
+def _yaml() -> Tuple[Any, Any, Any]:
+    """Import PyYAML, returning the module and its fastest safe loader and dumper.
+    
+    The libyaml-backed CSafeLoader and CSafeDumper are used when PyYAML was
+    built with them.
+    """
+    import yaml
+    
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    
+    return yaml, loader, dumper
+
+# Discovery results per directory, keyed by real path and tagged with the directory's mtime
+_discovery_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+def clear_discovery_cache() -> None:
+    """Forget cached discovery results, forcing the next discovery to rescan."""
+    _discovery_cache.clear()
+
+# Directories that never contain extensions and are not worth descending into.
+# Hidden directories (.git, .venv, in-progress .install-* extractions, ...)
+# are skipped as well.
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules", "venv"})
+
+def _iter_extension_inits(directory: str):
+    """Yield the path of every __init__.py below a directory.
+    
+    Walks the tree depth-first with os.scandir(), using the cached DirEntry
+    type information instead of a stat() per entry, and skips _SKIP_DIRS
+    and hidden directories.
+    Symlinked directories are not followed.
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                        subdirs.append(entry.path)
+                elif entry.name == "__init__.py":
+                    yield entry.path
+        # Reversed so that subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+# Loaded extension modules, keyed by real path and tagged with the file's mtime
+_module_cache: Dict[str, Tuple[int, Any]] = {}
+
+def _module_name_for(path: str) -> str:
+    """Derive a stable module name, unique per extension file, for sys.modules."""
+    return "extension_" + hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+
+def _forget_modules(directory: str) -> None:
+    """Drop the cached modules loaded from files under a directory, and their sys.modules entries.
+    
+    Call this before the directory is deleted, so that extensions that are
+    uninstalled, replaced or only loaded from a temporary directory are not
+    kept alive.
+    """
+    prefix = os.path.join(os.path.realpath(directory), "")
+    for real_path in [p for p in _module_cache if p.startswith(prefix)]:
+        del _module_cache[real_path]
+        sys.modules.pop(_module_name_for(real_path), None)
+
 def load_extension_module(path: str) -> Optional[Any]:
     """Load an extension module from a file path.
     
+    Modules are cached per file and only re-executed after the file's mtime
+    changes.
+    
     Args:
         path: The path to the extension module.
         
@@ -32,14 +109,27 @@ def load_extension_module(path: str) -> Optional[Any]:
         The loaded module, or None if loading failed.
     """
     try:
-        spec = importlib.util.spec_from_file_location("extension_module", path)
+        real_path = os.path.realpath(path)
+        mtime = os.stat(real_path).st_mtime_ns
+        cached = _module_cache.get(real_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        module_name = _module_name_for(real_path)
+        spec = importlib.util.spec_from_file_location(module_name, real_path)
         if spec is None:
             logger.error(f"Failed to create module spec from {path}")
             return None
         
         module = importlib.util.module_from_spec(spec)
-        sys.modules["extension_module"] = module
-        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        
+        _module_cache[real_path] = (mtime, module)
         return module
     except Exception as e:
         logger.error(f"Failed to load extension module {path}: {e}")
@@ -48,6 +138,8 @@ def load_extension_module(path: str) -> Optional[Any]:
 def find_extension_class(module: Any) -> Optional[Type[Extension]]:
     """Find an Extension subclass in a module.
     
+    The result is cached on the module as ``__extension_class__``.
+    
     Args:
         module: The module to search.
         
@@ -55,11 +147,19 @@ def find_extension_class(module: Any) -> Optional[Type[Extension]]:
         The Extension subclass, or None if not found.
     """
     try:
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and 
+        namespace = vars(module)
+        cached = namespace.get("__extension_class__")
+        if cached is not None:
+            return cached
+        
+        # Scan the module namespace directly; getmembers() would sort and getattr() every name
+        for obj in namespace.values():
+            if (isinstance(obj, type) and 
                 issubclass(obj, Extension) and 
-                obj != Extension and
-                not inspect.isabstract(obj)):
+                obj is not Extension and
+                not inspect.isabstract(obj) and
+                not obj._missing_metadata):
+                module.__extension_class__ = obj
                 return obj
         logger.warning(f"No Extension subclass found in module {module.__name__}")
         return None
@@ -95,6 +195,9 @@ def load_extension(path: str) -> Optional[Extension]:
 def discover_extensions(directory: str) -> List[str]:
     """Discover extension modules in a directory.
     
+    Results are cached until the directory's mtime changes; call
+    clear_discovery_cache() after changing files deeper in the tree.
+    
     Args:
         directory: The directory to search.
         
@@ -104,9 +207,16 @@ def discover_extensions(directory: str) -> List[str]:
     extension_paths = []
     
     try:
-        for root, dirs, files in os.walk(directory):
-            if "__init__.py" in files:
-                extension_paths.append(os.path.join(root, "__init__.py"))
+        # Reuse the previous scan while the directory itself is unchanged
+        cache_key = os.path.realpath(directory)
+        mtime = os.stat(directory).st_mtime_ns
+        cached = _discovery_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+        
+        extension_paths.extend(_iter_extension_inits(directory))
+        
+        _discovery_cache[cache_key] = (mtime, list(extension_paths))
     except Exception as e:
         logger.error(f"Error discovering extensions in {directory}: {e}")
     
@@ -122,14 +232,16 @@ def load_extension_config(path: str) -> Dict[str, Any]:
         The configuration as a dictionary.
     """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            if path.endswith(".yaml") or path.endswith(".yml"):
-                return yaml.safe_load(f) or {}
-            elif path.endswith(".json"):
-                return json.load(f)
-            else:
-                logger.warning(f"Unknown configuration file format: {path}")
-                return {}
+        if path.endswith(".yaml") or path.endswith(".yml"):
+            yaml, loader, _ = _yaml()
+            with open(path, "r", encoding="utf-8") as f:
+                return yaml.load(f, Loader=loader) or {}
+        elif path.endswith(".json"):
+            with open(path, "rb") as f:
+                return json_loads(f.read())
+        else:
+            logger.warning(f"Unknown configuration file format: {path}")
+            return {}
     except Exception as e:
         logger.error(f"Error loading extension configuration from {path}: {e}")
         return {}
@@ -147,22 +259,29 @@ def save_extension_config(config: Dict[str, Any], path: str) -> bool:
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
         
-        with open(path, "w", encoding="utf-8") as f:
-            if path.endswith(".yaml") or path.endswith(".yml"):
-                yaml.dump(config, f, default_flow_style=False)
-            elif path.endswith(".json"):
-                json.dump(config, f, indent=2)
-            else:
-                logger.warning(f"Unknown configuration file format: {path}")
-                return False
+        if path.endswith(".yaml") or path.endswith(".yml"):
+            yaml, _, dumper = _yaml()
+            with open(path, "w", encoding="utf-8") as f:
+                yaml.dump(config, f, Dumper=dumper, default_flow_style=False)
+        elif path.endswith(".json"):
+            with open(path, "wb") as f:
+                f.write(json_dumps(config))
+        else:
+            logger.warning(f"Unknown configuration file format: {path}")
+            return False
         return True
     except Exception as e:
         logger.error(f"Error saving extension configuration to {path}: {e}")
         return False
 
+# Read size used when hashing files without hashlib.file_digest()
+_HASH_CHUNK_SIZE = 1 << 20
+
 def hash_file(path: str) -> str:
     """Calculate the SHA-256 hash of a file.
     
+    The file is streamed through the hash rather than read into memory.
+    
     Args:
         path: The path to the file.
         
@@ -170,8 +289,18 @@ def hash_file(path: str) -> str:
         The hexadecimal digest of the hash.
     """
     try:
-        with open(path, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()
+        with open(path, "rb", buffering=0) as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            
+            # Hash in fixed-size chunks read into one reusable buffer
+            digest = hashlib.sha256()
+            buffer = memoryview(bytearray(_HASH_CHUNK_SIZE))
+            size = f.readinto(buffer)
+            while size:
+                digest.update(buffer[:size])
+                size = f.readinto(buffer)
+            return digest.hexdigest()
     except Exception as e:
         logger.error(f"Error calculating hash for {path}: {e}")
         return ""
@@ -187,6 +316,8 @@ def download_file(url: str, target_path: str) -> bool:
         True if the file was downloaded successfully, False otherwise.
     """
     try:
+        import requests
+        
         response = requests.get(url, stream=True)
         response.raise_for_status()
         
@@ -199,60 +330,193 @@ def download_file(url: str, target_path: str) -> bool:
         logger.error(f"Error downloading file from {url}: {e}")
         return False
 
-def install_extension_from_zip(zip_path: str, extensions_dir: str) -> Optional[str]:
-    """Install an extension from a ZIP file.
+def _aiohttp() -> Any:
+    """Import aiohttp, which the asynchronous download functions need.
+    
+    Raises:
+        ImportError: If aiohttp is not installed.
+    """
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "aiohttp is required for asynchronous downloads; "
+            "install it with: pip install 'open-webui-extensions[async]'"
+        ) from e
+    
+    return aiohttp
+
+async def download_file_async(url: str, target_path: str, session: Any = None) -> bool:
+    """Download a file from a URL without blocking the event loop.
+    
+    Several downloads can run concurrently with asyncio.gather().
     
     Args:
-        zip_path: The path to the ZIP file.
+        url: The URL to download from.
+        target_path: The path to save the file to.
+        session: An optional aiohttp.ClientSession to reuse across downloads.
+        
+    Returns:
+        True if the file was downloaded successfully, False otherwise.
+    
+    Raises:
+        ImportError: If aiohttp is not installed.
+    """
+    aiohttp = _aiohttp()
+    
+    try:
+        import aiofiles
+        
+        async with AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(aiohttp.ClientSession())
+            
+            response = await stack.enter_async_context(session.get(url))
+            response.raise_for_status()
+            
+            async with aiofiles.open(target_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(1 << 20):
+                    await f.write(chunk)
+        
+        return True
+    except Exception as e:
+        logger.error(f"Error downloading file from {url}: {e}")
+        return False
+
+# Downloads up to this size are buffered in memory rather than on disk
+_SPOOL_MAX_SIZE = 64 << 20
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hard-link a file, falling back to a regular copy.
+    
+    Linking fails across filesystems and on filesystems without hard links,
+    in which case the file is copied with shutil.copy2().
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+def _link_tree(source_dir: str, target_dir: str) -> None:
+    """Copy a directory tree, hard-linking files where possible."""
+    shutil.copytree(source_dir, target_dir, copy_function=_link_or_copy)
+
+# Largest total uncompressed size accepted for an extension archive
+_MAX_INSTALL_SIZE = 256 << 20
+
+class ArchiveTooLargeError(ValueError):
+    """Raised when an extension archive expands to more than the allowed size."""
+
+def extract_archive(zip_ref: Any, target_dir: str, max_size: int = _MAX_INSTALL_SIZE) -> None:
+    """Extract a ZIP archive, rejecting oversized archives and unsafe paths.
+    
+    Unlike ZipFile.extractall(), the declared uncompressed sizes are checked
+    before anything is written, so a small archive cannot expand to fill the
+    disk. Entries are streamed to disk one at a time.
+    
+    Args:
+        zip_ref: The open ZipFile.
+        target_dir: The directory to extract to.
+        max_size: The maximum total uncompressed size, in bytes.
+        
+    Raises:
+        ArchiveTooLargeError: If the archive is too large.
+        ValueError: If an entry would be extracted outside target_dir.
+    """
+    members = zip_ref.infolist()
+    total_size = sum(info.file_size for info in members)
+    if total_size > max_size:
+        raise ArchiveTooLargeError(f"Archive expands to {total_size} bytes, more than the {max_size} allowed")
+    
+    root = os.path.realpath(target_dir)
+    for info in members:
+        path = os.path.realpath(os.path.join(root, info.filename))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError(f"Archive entry {info.filename!r} is outside the extraction directory")
+        
+        if info.is_dir():
+            os.makedirs(path, exist_ok=True)
+            continue
+        
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # ZipExtFile never returns more than the declared file_size
+        with zip_ref.open(info) as src, open(path, "wb") as dst:
+            shutil.copyfileobj(src, dst, _HASH_CHUNK_SIZE)
+
+def _install_from_archive(archive: Any, source: str, extensions_dir: str) -> Optional[str]:
+    """Extract an extension archive into extensions_dir and install it.
+    
+    The archive is extracted into a temporary directory inside extensions_dir,
+    so the extension directory can be renamed into place instead of copied.
+    
+    Args:
+        archive: A path to a ZIP file, or a seekable binary file object.
+        source: A description of the archive's origin, used in log messages.
         extensions_dir: The directory to install the extension to.
         
     Returns:
         The path to the installed extension, or None if installation failed.
     """
+    import zipfile
+    
+    os.makedirs(extensions_dir, exist_ok=True)
+    temp_dir = tempfile.mkdtemp(prefix=".install-", dir=extensions_dir)
     try:
-        temp_dir = tempfile.mkdtemp()
-        
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(temp_dir)
+        with zipfile.ZipFile(archive, "r") as zip_ref:
+            extract_archive(zip_ref, temp_dir)
         
         # Find the extension directory
-        extension_dir = None
-        for root, dirs, files in os.walk(temp_dir):
-            if "__init__.py" in files:
-                extension_dir = root
-                break
-        
-        if extension_dir is None:
-            logger.error(f"No extension found in ZIP file {zip_path}")
-            shutil.rmtree(temp_dir)
+        init_path = next(_iter_extension_inits(temp_dir), None)
+        
+        if init_path is None:
+            logger.error(f"No extension found in ZIP file {source}")
             return None
         
         # Load the extension to get its name
-        extension = load_extension(os.path.join(extension_dir, "__init__.py"))
+        extension_dir = os.path.dirname(init_path)
+        extension = load_extension(init_path)
         if extension is None:
-            logger.error(f"Failed to load extension from ZIP file {zip_path}")
-            shutil.rmtree(temp_dir)
+            logger.error(f"Failed to load extension from ZIP file {source}")
             return None
         
         # Install the extension
         target_dir = os.path.join(extensions_dir, extension.name)
         if os.path.exists(target_dir):
             logger.warning(f"Extension {extension.name} already exists, removing")
+            _forget_modules(target_dir)
             shutil.rmtree(target_dir)
         
-        shutil.copytree(extension_dir, target_dir)
-        shutil.rmtree(temp_dir)
+        os.replace(extension_dir, target_dir)
+        clear_discovery_cache()
         
         return target_dir
+    finally:
+        _forget_modules(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def install_extension_from_zip(zip_path: str, extensions_dir: str) -> Optional[str]:
+    """Install an extension from a ZIP file.
+    
+    Args:
+        zip_path: The path to the ZIP file.
+        extensions_dir: The directory to install the extension to.
+        
+    Returns:
+        The path to the installed extension, or None if installation failed.
+    """
+    try:
+        return _install_from_archive(zip_path, zip_path, extensions_dir)
     except Exception as e:
         logger.error(f"Error installing extension from ZIP file {zip_path}: {e}")
-        if "temp_dir" in locals():
-            shutil.rmtree(temp_dir)
         return None
 
 def install_extension_from_url(url: str, extensions_dir: str) -> Optional[str]:
     """Install an extension from a URL.
     
+    The archive is hashed while it downloads and is extracted straight from
+    the download buffer, without an intermediate ZIP file.
+    
     Args:
         url: The URL to download from.
         extensions_dir: The directory to install the extension to.
@@ -261,6 +525,8 @@ def install_extension_from_url(url: str, extensions_dir: str) -> Optional[str]:
         The path to the installed extension, or None if installation failed.
     """
     try:
+        import requests
+        
         # Parse the URL to get the filename
         parsed_url = urlparse(url)
         filename = os.path.basename(parsed_url.path)
@@ -269,25 +535,83 @@ def install_extension_from_url(url: str, extensions_dir: str) -> Optional[str]:
             logger.error(f"URL does not point to a ZIP file: {url}")
             return None
         
-        # Download the ZIP file
-        temp_file = tempfile.mktemp(suffix=".zip")
-        if not download_file(url, temp_file):
-            return None
+        # Download the ZIP file, hashing it on the way
+        digest = hashlib.sha256()
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as archive:
+            with requests.get(url, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    digest.update(chunk)
+                    archive.write(chunk)
+            
+            logger.info(f"Downloaded {url} (sha256 {digest.hexdigest()})")
+            
+            # Install the extension from the downloaded archive
+            archive.seek(0)
+            return _install_from_archive(archive, url, extensions_dir)
+    except Exception as e:
+        logger.error(f"Error installing extension from URL {url}: {e}")
+        return None
+
+async def install_extension_from_url_async(url: str, extensions_dir: str, session: Any = None) -> Optional[str]:
+    """Install an extension from a URL without blocking the event loop.
+    
+    The download runs on the event loop; extraction and loading run in the
+    default executor. Several installs can run concurrently with
+    asyncio.gather().
+    
+    Args:
+        url: The URL to download from.
+        extensions_dir: The directory to install the extension to.
+        session: An optional aiohttp.ClientSession to reuse across downloads.
+        
+    Returns:
+        The path to the installed extension, or None if installation failed.
+    
+    Raises:
+        ImportError: If aiohttp is not installed.
+    """
+    aiohttp = _aiohttp()
+    
+    try:
+        # Parse the URL to get the filename
+        parsed_url = urlparse(url)
+        filename = os.path.basename(parsed_url.path)
         
-        # Install the extension from the ZIP file
-        extension_path = install_extension_from_zip(temp_file, extensions_dir)
-        os.remove(temp_file)
+        if not filename.endswith(".zip"):
+            logger.error(f"URL does not point to a ZIP file: {url}")
+            return None
         
-        return extension_path
+        # Download the ZIP file, hashing it on the way
+        digest = hashlib.sha256()
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as archive:
+            async with AsyncExitStack() as stack:
+                if session is None:
+                    session = await stack.enter_async_context(aiohttp.ClientSession())
+                
+                response = await stack.enter_async_context(session.get(url))
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(1 << 20):
+                    digest.update(chunk)
+                    archive.write(chunk)
+            
+            logger.info(f"Downloaded {url} (sha256 {digest.hexdigest()})")
+            
+            # Install the extension from the downloaded archive
+            archive.seek(0)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _install_from_archive, archive, url, extensions_dir)
     except Exception as e:
         logger.error(f"Error installing extension from URL {url}: {e}")
-        if "temp_file" in locals() and os.path.exists(temp_file):
-            os.remove(temp_file)
         return None
 
 def install_extension_from_directory(source_dir: str, extensions_dir: str) -> Optional[str]:
     """Install an extension from a directory.
     
+    Files are hard-linked into place when the source is on the same
+    filesystem, so the installed files share storage with the source;
+    editors that rewrite files in place will change both.
+    
     Args:
         source_dir: The source directory.
         extensions_dir: The directory to install the extension to.
@@ -311,9 +635,11 @@ def install_extension_from_directory(source_dir: str, extensions_dir: str) -> Op
         target_dir = os.path.join(extensions_dir, extension.name)
         if os.path.exists(target_dir):
             logger.warning(f"Extension {extension.name} already exists, removing")
+            _forget_modules(target_dir)
             shutil.rmtree(target_dir)
         
-        shutil.copytree(source_dir, target_dir)
+        _link_tree(source_dir, target_dir)
+        clear_discovery_cache()
         
         return target_dir
     except Exception as e:
@@ -336,7 +662,9 @@ def uninstall_extension(extension_name: str, extensions_dir: str) -> bool:
             logger.error(f"Extension {extension_name} not found in {extensions_dir}")
             return False
         
+        _forget_modules(extension_dir)
         shutil.rmtree(extension_dir)
+        clear_discovery_cache()
         return True
     except Exception as e:
         logger.error(f"Error uninstalling extension {extension_name}: {e}")
@@ -353,58 +681,89 @@ def get_extension_dependencies(extension: Extension) -> Set[str]:
     """
     return set(extension.dependencies)
 
-def resolve_extension_dependencies(extensions: List[Extension]) -> List[Tuple[Extension, Set[str]]]:
+@dataclass
+class DependencyGraph:
+    """Extensions indexed by name, together with their declared dependencies.
+    
+    Build it once with DependencyGraph.build() and pass it to
+    resolve_extension_dependencies() and sort_extensions_by_dependencies()
+    to avoid recomputing it for every call.
+    """
+    
+    extensions: Dict[str, Extension]
+    dependencies: Dict[str, FrozenSet[str]]
+    
+    @classmethod
+    def build(cls, extensions: List[Extension]) -> "DependencyGraph":
+        """Build the graph for a list of extensions."""
+        return cls(
+            {ext.name: ext for ext in extensions},
+            {ext.name: frozenset(ext.dependencies) for ext in extensions},
+        )
+
+def resolve_extension_dependencies(extensions: List[Extension], graph: Optional[DependencyGraph] = None) -> List[Tuple[Extension, Set[str]]]:
     """Resolve dependencies between extensions.
     
     Args:
         extensions: A list of extensions.
+        graph: A prebuilt dependency graph for the extensions, if available.
         
     Returns:
         A list of tuples containing the extension and its unresolved dependencies.
     """
-    # Create a dictionary mapping extension names to extensions
-    extension_map = {ext.name: ext for ext in extensions}
-    
-    # Create a dictionary mapping extension names to unresolved dependencies
-    unresolved_deps = {}
-    for ext in extensions:
-        deps = get_extension_dependencies(ext)
-        unresolved = deps - set(extension_map.keys())
-        unresolved_deps[ext.name] = unresolved
+    if graph is None:
+        graph = DependencyGraph.build(extensions)
+    extension_map = graph.extensions
     
     # Return extensions with their unresolved dependencies
-    return [(ext, unresolved_deps[ext.name]) for ext in extensions]
+    return [
+        (ext, {dep for dep in graph.dependencies[ext.name] if dep not in extension_map})
+        for ext in extensions
+    ]
 
-def sort_extensions_by_dependencies(extensions: List[Extension]) -> List[Extension]:
+def sort_extensions_by_dependencies(extensions: List[Extension], graph: Optional[DependencyGraph] = None) -> List[Extension]:
     """Sort extensions by their dependencies.
     
+    Extensions caught in a dependency cycle are logged and placed after all
+    the others, in their original order.
+    
     Args:
         extensions: A list of extensions.
+        graph: A prebuilt dependency graph for the extensions, if available.
         
     Returns:
         A list of extensions sorted by their dependencies.
     """
-    # Create a dictionary mapping extension names to extensions
-    extension_map = {ext.name: ext for ext in extensions}
+    if graph is None:
+        graph = DependencyGraph.build(extensions)
+    extension_map = graph.extensions
+    deps = graph.dependencies
     
-    # Create a dictionary mapping extension names to dependencies
-    deps = {ext.name: get_extension_dependencies(ext) for ext in extensions}
+    # Count each extension's known dependencies and index its dependents
+    in_degree = dict.fromkeys(extension_map, 0)
+    dependents = defaultdict(list)
+    for name in extension_map:
+        for dep in deps[name]:
+            if dep in extension_map:
+                dependents[dep].append(name)
+                in_degree[name] += 1
     
-    # Sort extensions by dependencies
+    # Kahn's algorithm: emit extensions once all of their dependencies have been emitted
+    queue = deque(name for name, degree in in_degree.items() if degree == 0)
     sorted_names = []
-    visited = set()
-    
-    def visit(name):
-        if name in visited:
-            return
-        visited.add(name)
-        for dep in deps.get(name, set()):
-            if dep in extension_map:
-                visit(dep)
+    while queue:
+        name = queue.popleft()
         sorted_names.append(name)
+        for dependent in dependents[name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
     
-    for ext in extensions:
-        visit(ext.name)
+    # Whatever is left is part of, or depends on, a dependency cycle
+    if len(sorted_names) != len(extension_map):
+        cyclic = [name for name, degree in in_degree.items() if degree > 0]
+        logger.error(f"Dependency cycle detected between extensions: {', '.join(cyclic)}")
+        sorted_names.extend(cyclic)
     
     # Return extensions in dependency order
     return [extension_map[name] for name in sorted_names]
@@ -6,19 +6,37 @@ This module provides a management interface for Open WebUI extensions.
 
 import os
 import logging
+import importlib
 from typing import Dict, Any, Optional, Callable
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
 logger = logging.getLogger("extension_manager")
 
-# Import API router
-from .backend.api import get_router
-from .backend.registry import registry
+__all__ = [
+    "initialize",
+    "initialize_registry",
+    "get_api_router",
+    "register_with_app",
+    "get_ui_mount_points",
+    "get_router",
+    "registry",
+]
+
+# The API router and registry pull in FastAPI and the extension framework, so
+# they are only imported when first accessed (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "get_router": ".backend.api",
+    "registry": ".backend.registry",
+}
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported attributes on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 # Initialize the extension manager
 def initialize(config: Optional[Dict[str, Any]] = None) -> bool:
@@ -77,6 +95,7 @@ def get_api_router() -> Any:
     Returns:
         The API router.
     """
+    from .backend.api import get_router
     return get_router()
 
 def register_with_app(app: Any, prefix: str = "/api/extensions") -> bool:
@@ -89,12 +108,14 @@ def register_with_app(app: Any, prefix: str = "/api/extensions") -> bool:
     Returns:
         True if registration was successful, False otherwise.
     """
+    from extension_framework.serialization import default_response_class
+    
     try:
         # Get the API router
         router = get_api_router()
         
         # Include the router in the application
-        app.include_router(router, prefix=prefix)
+        app.include_router(router, prefix=prefix, default_response_class=default_response_class())
         
         return True
     except Exception as e:
@@ -4,9 +4,13 @@ API endpoints for the Extension Manager.
 This module provides the API endpoints for managing extensions in Open WebUI.
 """
 
-from typing import Dict, List, Any, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Callable, Dict, Hashable, List, Any, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+import base64
+import hashlib
 import logging
+import secrets
 
 from .models import (
     ExtensionInfo,
@@ -20,6 +24,8 @@ from .models import (
     ExtensionFilters,
     ExtensionActionResponse,
     ExtensionListResponse,
+    construct_model,
+    model_to_json,
 )
 
 from .registry import registry
@@ -28,71 +34,204 @@ router = APIRouter(prefix="/api/extensions", tags=["extensions"])
 
 logger = logging.getLogger("extension_api")
 
+# Responses of the read endpoints, valid while the registry version is unchanged
+_RESPONSE_CACHE_SIZE = 256
+_response_cache: Dict[Hashable, Any] = {}
+_response_cache_version = -1
+
+async def _cached_response(key: Hashable, build: Callable[[], Any]) -> Any:
+    """Get a read endpoint's response from the cache, building it on a miss.
+    
+    The whole cache is dropped as soon as the registry version changes, so
+    responses never outlive an install, uninstall, toggle or settings update.
+    Responses are built in the threadpool, since the registry lock may be held
+    by a long-running install or discovery.
+    """
+    global _response_cache_version
+    
+    # Read the version before building, so a concurrent change can only make
+    # the built response newer than its version, never older
+    version = registry.version
+    if version != _response_cache_version:
+        _response_cache.clear()
+        _response_cache_version = version
+    
+    response = _response_cache.get(key)
+    if response is None:
+        response = await run_in_threadpool(build)
+        # While this response was being built, another request may have moved
+        # the cache on to a newer version; the response may predate it then
+        if version == _response_cache_version:
+            if len(_response_cache) >= _RESPONSE_CACHE_SIZE:
+                _response_cache.clear()
+            _response_cache[key] = response
+    return response
+
+# Distinguishes this process's ETags, since the registry version restarts at zero
+_ETAG_SALT = secrets.token_hex(4)
+
+def _etag(key: Hashable) -> str:
+    """Build a weak ETag for a read endpoint's response at the current registry version."""
+    digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=8, key=_ETAG_SALT.encode("ascii")).hexdigest()
+    return f'W/"{registry.version}-{digest}"'
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Get a 304 response if the client already has the response tagged etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+def _encode_cursor(name: str) -> str:
+    """Encode the last listed extension name as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(name.encode("utf-8")).decode("ascii").rstrip("=")
+
+def _decode_cursor(cursor: str) -> str:
+    """Decode a pagination cursor back into an extension name."""
+    try:
+        return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.get("/", response_model=ExtensionListResponse)
 async def list_extensions(
+    request: Request,
     types: List[ExtensionType] = Query(None),
     status: List[ExtensionStatus] = Query(None),
     sources: List[ExtensionSource] = Query(None),
     search: Optional[str] = None,
-    page: int = 1,
-    page_size: int = 10,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ):
-    """List all extensions."""
+    """List all extensions.
+    
+    Extensions are listed in name order. Pass the previous response's
+    next_cursor as ``cursor`` to fetch the following page without rescanning
+    earlier ones; ``page`` is ignored in that case and ``total`` counts only
+    the extensions after the cursor.
+    
+    Counting every match means scanning the whole registry, so ``total`` is
+    only filled in when ``include_total`` is set; ``has_more`` tells whether
+    another page follows either way.
+    
+    List responses grow with the number of extensions, so they are cached
+    already encoded and returned as-is, bypassing FastAPI's response_model
+    validation and jsonable_encoder. Clients that send back the ETag in
+    If-None-Match get an empty 304 until the registry changes.
+    """
+    after = _decode_cursor(cursor) if cursor is not None else None
+    
+    key = ("list", tuple(types or ()), tuple(status or ()), tuple(sources or ()), search, page, page_size, after, include_total)
+    etag = _etag(key)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
     try:
-        # Create filters
-        filters = ExtensionFilters(
-            types=types,
-            status=status,
-            sources=sources,
-            search=search,
-        )
-        
-        # Get extensions from registry
-        extensions = registry.list_extensions(filters)
-        
-        # Paginate results
-        total = len(extensions)
-        start = (page - 1) * page_size
-        end = start + page_size
-        extensions = extensions[start:end]
-        
-        return ExtensionListResponse(
-            success=True,
-            message=f"Found {total} extensions",
-            extensions=extensions,
-            total=total,
-            page=page,
-            page_size=page_size,
-            filters=filters,
+        body = await _cached_response(
+            key,
+            lambda: model_to_json(_list_extensions_response(types, status, sources, search, page, page_size, after, include_total)),
         )
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
-        logger.error(f"Error listing extensions: {e}")
+        logger.error("Error listing extensions: %s", e)
         raise HTTPException(status_code=500, detail=f"Error listing extensions: {e}")
 
+def _list_extensions_response(
+    types: Optional[List[ExtensionType]],
+    status: Optional[List[ExtensionStatus]],
+    sources: Optional[List[ExtensionSource]],
+    search: Optional[str],
+    page: int,
+    page_size: int,
+    after: Optional[str],
+    include_total: bool,
+) -> ExtensionListResponse:
+    """Build the response for one page of the extension list."""
+    # Create filters; the query parameters were already validated by FastAPI
+    filters = construct_model(
+        ExtensionFilters,
+        types=types,
+        status=status,
+        sources=sources,
+        search=search,
+    )
+    
+    # Get the requested page of extensions from the registry
+    offset = 0 if after is not None else (page - 1) * page_size
+    extensions, total, has_more = registry.list_extensions(
+        filters,
+        offset=offset,
+        limit=page_size,
+        after=after,
+        count_total=include_total,
+    )
+    
+    next_cursor = None
+    if extensions and has_more:
+        next_cursor = _encode_cursor(extensions[-1].name)
+    
+    if total is not None:
+        message = f"Found {total} extensions"
+    else:
+        message = f"Found {len(extensions)} extensions" + (" (more available)" if has_more else "")
+    
+    # Everything here comes from the registry and is already validated
+    return construct_model(
+        ExtensionListResponse,
+        success=True,
+        message=message,
+        extensions=extensions,
+        total=total,
+        page=page,
+        page_size=page_size,
+        filters=filters,
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
+
 @router.get("/{name}", response_model=ExtensionActionResponse)
-async def get_extension(name: str):
+async def get_extension(name: str, request: Request, response: Response):
     """Get information about an extension."""
+    key = ("get", name)
+    etag = _etag(key)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
     try:
-        # Get extension info
-        ext_info = registry.get_extension_info(name)
-        
-        if not ext_info:
-            return ExtensionActionResponse(
-                success=False,
-                message=f"Extension {name} not found",
-            )
-        
-        return ExtensionActionResponse(
-            success=True,
-            message=f"Extension {name} found",
-            extension=ext_info,
-        )
+        response.headers["ETag"] = etag
+        return await _cached_response(key, lambda: _get_extension_response(name))
     except Exception as e:
-        logger.error(f"Error getting extension {name}: {e}")
+        logger.error("Error getting extension %s: %s", name, e)
         raise HTTPException(status_code=500, detail=f"Error getting extension: {e}")
 
+def _get_extension_response(name: str) -> ExtensionActionResponse:
+    """Build the response describing a single extension."""
+    # Get extension info
+    ext_info = registry.get_extension_info(name)
+    
+    if not ext_info:
+        return ExtensionActionResponse(
+            success=False,
+            message=f"Extension {name} not found",
+        )
+    
+    return construct_model(
+        ExtensionActionResponse,
+        success=True,
+        message=f"Extension {name} found",
+        extension=ext_info,
+    )
+
 @router.post("/install", response_model=ExtensionActionResponse)
-async def install_extension(install_info: ExtensionInstall):
+def install_extension(install_info: ExtensionInstall):
     """Install an extension."""
     try:
         # Install the extension
@@ -109,89 +248,72 @@ async def install_extension(install_info: ExtensionInstall):
             extension=ext_info,
         )
     except Exception as e:
-        logger.error(f"Error installing extension: {e}")
+        logger.error("Error installing extension: %s", e)
         raise HTTPException(status_code=500, detail=f"Error installing extension: {e}")
 
 @router.post("/action", response_model=ExtensionActionResponse)
-async def extension_action(action_info: ExtensionAction):
+def extension_action(action_info: ExtensionAction):
     """Perform an action on an extension."""
     try:
-        # Get extension info
-        ext_info = registry.get_extension_info(action_info.name)
-        
-        if not ext_info:
-            return ExtensionActionResponse(
-                success=False,
-                message=f"Extension {action_info.name} not found",
-            )
-        
-        # Perform the action
+        # Perform the action; the registry reports unknown extensions itself
         if action_info.action == "enable":
-            success, message = registry.enable_extension(action_info.name)
+            success, ext_info, message = registry.enable_extension(action_info.name)
         elif action_info.action == "disable":
-            success, message = registry.disable_extension(action_info.name)
+            success, ext_info, message = registry.disable_extension(action_info.name)
         elif action_info.action == "uninstall":
             success, message = registry.uninstall_extension(action_info.name)
+            ext_info = None
         else:
+            ext_info = registry.get_extension_info(action_info.name)
+            if not ext_info:
+                return ExtensionActionResponse(
+                    success=False,
+                    message=f"Extension {action_info.name} not found",
+                )
+            
             return ExtensionActionResponse(
                 success=False,
                 message=f"Unknown action: {action_info.action}",
                 extension=ext_info,
             )
         
-        # Get updated extension info if the action was successful
-        if success and action_info.action != "uninstall":
-            ext_info = registry.get_extension_info(action_info.name)
-        
         return ExtensionActionResponse(
             success=success,
             message=message,
-            extension=ext_info if action_info.action != "uninstall" else None,
+            extension=ext_info,
         )
     except Exception as e:
-        logger.error(f"Error performing action {action_info.action} on extension {action_info.name}: {e}")
+        logger.error("Error performing action %s on extension %s: %s", action_info.action, action_info.name, e)
         raise HTTPException(status_code=500, detail=f"Error performing action: {e}")
 
 @router.post("/settings", response_model=ExtensionActionResponse)
-async def update_settings(settings_info: ExtensionSettings):
+def update_settings(settings_info: ExtensionSettings):
     """Update extension settings."""
     try:
-        # Get extension info
-        ext_info = registry.get_extension_info(settings_info.name)
-        
-        if not ext_info:
-            return ExtensionActionResponse(
-                success=False,
-                message=f"Extension {settings_info.name} not found",
-            )
-        
-        # Update settings
-        success, message = registry.update_extension_settings(
+        # Update settings; the registry reports unknown extensions itself
+        success, ext_info, message = registry.update_extension_settings(
             settings_info.name,
             settings_info.settings,
         )
         
-        # Get updated extension info
-        if success:
-            ext_info = registry.get_extension_info(settings_info.name)
-        
         return ExtensionActionResponse(
             success=success,
             message=message,
             extension=ext_info,
         )
     except Exception as e:
-        logger.error(f"Error updating settings for extension {settings_info.name}: {e}")
+        logger.error("Error updating settings for extension %s: %s", settings_info.name, e)
         raise HTTPException(status_code=500, detail=f"Error updating settings: {e}")
 
 @router.post("/discover", response_model=ExtensionListResponse)
-async def discover_extensions():
+def discover_extensions():
     """Discover installed extensions."""
     try:
         # Discover extensions
         extensions = registry.discover()
         
-        return ExtensionListResponse(
+        return construct_model(
+            ExtensionListResponse,
             success=True,
             message=f"Discovered {len(extensions)} extensions",
             extensions=list(extensions.values()),
@@ -200,7 +322,7 @@ async def discover_extensions():
             page_size=len(extensions),
         )
     except Exception as e:
-        logger.error(f"Error discovering extensions: {e}")
+        logger.error("Error discovering extensions: %s", e)
         raise HTTPException(status_code=500, detail=f"Error discovering extensions: {e}")
 
 @router.post("/initialize", response_model=Dict[str, Any])
@@ -208,7 +330,7 @@ async def initialize_extensions():
     """Initialize all extensions."""
     try:
         # Initialize extensions
-        results = registry.initialize_all()
+        results = await registry.initialize_all_async()
         
         # Count successes and failures
         successes = sum(1 for success, _ in results.values() if success)
@@ -220,7 +342,7 @@ async def initialize_extensions():
             "results": {name: {"success": success, "message": message} for name, (success, message) in results.items()},
         }
     except Exception as e:
-        logger.error(f"Error initializing extensions: {e}")
+        logger.error("Error initializing extensions: %s", e)
         raise HTTPException(status_code=500, detail=f"Error initializing extensions: {e}")
 
 def get_router() -> APIRouter:
@@ -1,8 +1,42 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Type, TypeVar
 from enum import Enum
 from pydantic import BaseModel, Field
 import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Pydantic 2 renamed construct() to model_construct() and dict() to model_dump()
+_PYDANTIC_V2 = hasattr(BaseModel, "model_construct")
+_CONSTRUCT = "model_construct" if _PYDANTIC_V2 else "construct"
+
+def construct_model(model: Type[ModelT], **values: Any) -> ModelT:
+    """Create a model from already-validated values without running validation.
+    
+    Only use this with values that came from other models (e.g. the registry's
+    ExtensionInfo objects); nothing is checked or coerced.
+    """
+    return getattr(model, _CONSTRUCT)(**values)
+
+def model_to_dict(model: BaseModel) -> Dict[str, Any]:
+    """Dump a model to a dictionary of Python values."""
+    return model.model_dump() if _PYDANTIC_V2 else model.dict()
+
+def model_to_json(model: BaseModel) -> bytes:
+    """Serialize a model to JSON, using orjson when it is installed.
+    
+    orjson encodes the dumped values (including datetimes and enums) in C,
+    which is much faster than FastAPI's jsonable_encoder for large models.
+    """
+    if orjson is None:
+        return (model.model_dump_json() if _PYDANTIC_V2 else model.json()).encode("utf-8")
+    
+    return orjson.dumps(model.model_dump(mode="json") if _PYDANTIC_V2 else model.dict())
+
 class ExtensionStatus(str, Enum):
     """Status of an extension."""
     ACTIVE = "active"
@@ -99,7 +133,9 @@ class ExtensionListResponse(BaseModel):
     success: bool = True
     message: str = ""
     extensions: List[ExtensionInfo] = []
-    total: int = 0
+    total: Optional[int] = 0
     page: int = 1
     page_size: int = 10
     filters: Optional[ExtensionFilters] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
@@ -5,12 +5,21 @@ This module handles the discovery, loading, and management of extensions.
 """
 
 import os
+import asyncio
 import logging
 import json
+import stat
+import tempfile
 import yaml
 import datetime
-from typing import Dict, List, Any, Optional, Set, Tuple
+from enum import Enum
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Any, Optional, Set, Tuple
 import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from bisect import bisect_right
+from itertools import islice
 
 from extension_framework import (
     Extension,
@@ -25,6 +34,7 @@ from extension_framework import (
     resolve_extension_dependencies,
     sort_extensions_by_dependencies,
 )
+from extension_framework.serialization import json_dumps
 
 from .models import (
     ExtensionInfo,
@@ -34,10 +44,61 @@ from .models import (
     ExtensionSetting,
     ExtensionDependency,
     ExtensionFilters,
+    construct_model,
+    model_to_dict,
 )
 
 logger = logging.getLogger("extension_registry")
 
+# Use the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+class _RegistryDumper(_YamlDumper):
+    """Safe YAML dumper that writes enum members (e.g. ExtensionStatus) as their values."""
+    
+    def ignore_aliases(self, data: Any) -> bool:
+        # Extensions are dumped one at a time, so anchors would clash when joined
+        return True
+
+_RegistryDumper.add_multi_representer(Enum, lambda dumper, data: dumper.represent_str(data.value))
+
+def _write_atomically(path: str, chunks: Iterable[bytes]) -> None:
+    """Write a file through a temporary file, then rename it into place.
+    
+    Readers see either the old or the new contents, never a partial write,
+    and a crash mid-write leaves the old file intact. The chunks are written
+    as they are produced, so the whole file never has to be in memory. Each
+    write gets its own temporary file, so concurrent writers (e.g. several
+    worker processes) cannot clobber each other's.
+    """
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp() creates the file readable by its owner only
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except OSError:
+                mode = 0o644
+            os.chmod(temp_path, mode)
+            
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+# Extension types by value, to skip the Enum lookup for every discovered extension
+_EXTENSION_TYPES: Dict[str, ExtensionType] = {member.value: member for member in ExtensionType}
+
 class ExtensionRegistry:
     """Registry for managing extensions."""
     
@@ -72,6 +133,45 @@ class ExtensionRegistry:
             self.extensions: Dict[str, ExtensionInfo] = {}
             self.instances: Dict[str, Extension] = {}
             
+            # Extension names in sorted order, rebuilt after extensions are added or removed
+            self._sorted_names: Optional[List[str]] = None
+            
+            # Dependency names per extension, and the reverse index of dependents
+            self._dependencies: Dict[str, FrozenSet[str]] = {}
+            self._dependents: Dict[str, Set[str]] = defaultdict(set)
+            
+            # Lowercased text that the search filter matches, per extension name
+            self._search_index: Dict[str, str] = {}
+            
+            # Incremented whenever the registry changes
+            self._version = 0
+            
+            # Number of in-place modifications of each extension, per name
+            self._revisions: Dict[str, int] = defaultdict(int)
+            
+            # Serialized form of each extension, with the info and revision it was built from
+            self._serialized: Dict[str, Tuple[ExtensionInfo, int, Dict[str, Any]]] = {}
+            
+            # Fingerprint of the extensions directory when discover() last
+            # scanned it, or None if it has not scanned it yet
+            self._discovered_fingerprint: Optional[FrozenSet[Tuple[str, int]]] = None
+            
+            # Per-extension locks, see _lock_for()
+            self._extension_locks: Dict[str, threading.RLock] = {}
+            self._extension_locks_guard = threading.Lock()
+            
+            # Status each pending extension had before it became pending, and
+            # the enable_extension() call that marked it, if any; see _mark_pending()
+            self._pending: Dict[str, Tuple[ExtensionStatus, Optional[object]]] = {}
+            
+            # Extensions whose code was started by this process; the saved
+            # status only says which ones should be running
+            self._started: Set[str] = set()
+            
+            # Per-thread nesting depth of _batch() blocks ("depth"), and whether
+            # the thread deferred a save ("dirty")
+            self._batch_state = threading.local()
+            
             # Load the registry configuration
             self._load_config()
             
@@ -80,117 +180,325 @@ class ExtensionRegistry:
     def _load_config(self) -> None:
         """Load the registry configuration."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    if self.config_file.endswith(".yaml") or self.config_file.endswith(".yml"):
-                        config = yaml.safe_load(f) or {}
-                    elif self.config_file.endswith(".json"):
-                        config = json.load(f)
-                    else:
-                        logger.warning(f"Unknown config file format: {self.config_file}")
-                        config = {}
-                
-                # Load extensions from config
-                if "extensions" in config:
-                    for ext_info in config["extensions"]:
-                        self.extensions[ext_info["name"]] = ExtensionInfo(**ext_info)
+            try:
+                stat_result = os.stat(self.config_file)
+            except OSError:
+                return
+            
+            config = self._read_config_file((stat_result.st_mtime_ns, stat_result.st_size))
+            
+            # Load extensions from config; nothing is pending in a new process
+            for ext_info in config.get("extensions") or []:
+                ext_info = ExtensionInfo(**ext_info)
+                if ext_info.status == ExtensionStatus.PENDING:
+                    ext_info.status = ExtensionStatus.INACTIVE
+                self._add_extension(ext_info)
         except Exception as e:
             logger.error(f"Error loading registry configuration: {e}")
     
+    def _read_config_file(self, cache_key: Tuple[int, int]) -> Dict[str, Any]:
+        """Parse the registry configuration file.
+        
+        YAML configurations are parsed once and then read back from a JSON
+        sidecar (``<config>.cache.json``) for as long as the YAML file's mtime
+        and size match the ones recorded in the sidecar.
+        
+        Args:
+            cache_key: The (mtime_ns, size) of the configuration file.
+            
+        Returns:
+            The parsed configuration.
+        """
+        if self.config_file.endswith(".json"):
+            with open(self.config_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        
+        if not (self.config_file.endswith(".yaml") or self.config_file.endswith(".yml")):
+            logger.warning(f"Unknown config file format: {self.config_file}")
+            return {}
+        
+        sidecar_file = self.config_file + ".cache.json"
+        try:
+            with open(sidecar_file, "r", encoding="utf-8") as f:
+                sidecar = json.load(f)
+            if sidecar.get("source") == list(cache_key):
+                return sidecar["config"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        
+        with open(self.config_file, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_YamlLoader) or {}
+        
+        try:
+            sidecar = {"source": list(cache_key), "config": config}
+            _write_atomically(sidecar_file, [json.dumps(sidecar, default=str).encode("utf-8")])
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write registry cache {sidecar_file}: {e}")
+        
+        return config
+    
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        """Coalesce the configuration saves made inside the block into one write.
+        
+        The registry lock is not held for the whole block, so extensions can
+        be activated inside it without blocking readers. Only saves made by
+        the calling thread are deferred; other threads keep saving at once.
+        """
+        state = self._batch_state
+        state.depth = getattr(state, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            state.depth -= 1
+            if state.depth == 0 and getattr(state, "dirty", False):
+                with self._lock:
+                    state.dirty = False
+                    self._save_config_now()
+    
+    def _lock_for(self, name: str) -> threading.RLock:
+        """Get the lock serializing state changes of one extension.
+        
+        It is held while extension code runs (initialize, activate,
+        deactivate), whereas the registry lock only guards registry state.
+        Never acquire it while holding the registry lock.
+        """
+        lock = self._extension_locks.get(name)
+        if lock is None:
+            with self._extension_locks_guard:
+                lock = self._extension_locks.get(name)
+                if lock is None:
+                    lock = self._extension_locks[name] = threading.RLock()
+        return lock
+    
     def _save_config(self) -> None:
-        """Save the registry configuration."""
+        """Save the registry configuration, or defer it to the end of the calling thread's batch."""
+        # Every persistent change to the registry goes through here; pending
+        # states are not persisted, and bump the version in _mark_pending()
+        self._version += 1
+        
+        state = self._batch_state
+        if getattr(state, "depth", 0):
+            state.dirty = True
+        else:
+            self._save_config_now()
+    
+    def _save_config_now(self) -> None:
+        """Write the registry configuration to disk."""
         try:
-            config = {
-                "extensions": [ext.dict() for ext in self.extensions.values()]
-            }
-            
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
             
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                if self.config_file.endswith(".yaml") or self.config_file.endswith(".yml"):
-                    yaml.dump(config, f, default_flow_style=False)
-                elif self.config_file.endswith(".json"):
-                    json.dump(config, f, indent=2)
-                else:
-                    logger.warning(f"Unknown config file format: {self.config_file}")
+            if self.config_file.endswith(".yaml") or self.config_file.endswith(".yml"):
+                chunks = self._iter_yaml_config()
+            elif self.config_file.endswith(".json"):
+                chunks = self._iter_json_config()
+            else:
+                logger.warning(f"Unknown config file format: {self.config_file}")
+                return
+            
+            _write_atomically(self.config_file, chunks)
         except Exception as e:
             logger.error(f"Error saving registry configuration: {e}")
     
+    def _iter_yaml_config(self) -> Iterator[bytes]:
+        """Encode the registry configuration as YAML, one extension at a time.
+        
+        The output is the same as dumping ``{"extensions": [...]}`` in one go.
+        """
+        if not self.extensions:
+            yield b"extensions: []\n"
+            return
+        
+        yield b"extensions:\n"
+        for ext in self.extensions.values():
+            yield yaml.dump([self._serialize_extension(ext)], Dumper=_RegistryDumper, default_flow_style=False, sort_keys=False, encoding="utf-8")
+    
+    def _iter_json_config(self) -> Iterator[bytes]:
+        """Encode the registry configuration as indented JSON, one extension at a time."""
+        if not self.extensions:
+            yield b'{\n  "extensions": []\n}'
+            return
+        
+        yield b'{\n  "extensions": [\n    '
+        for i, ext in enumerate(self.extensions.values()):
+            if i:
+                yield b",\n    "
+            # Indent the entry to its depth inside the list
+            yield json_dumps(self._serialize_extension(ext)).replace(b"\n", b"\n    ")
+        yield b"\n  ]\n}"
+    
+    def _serialize_extension(self, ext_info: ExtensionInfo) -> Dict[str, Any]:
+        """Get an extension's configuration entry, reusing it while the extension is unchanged.
+        
+        Mutators call _touch(), which bumps the extension's revision.
+        Pending extensions are written with the status they had before.
+        """
+        if ext_info.status == ExtensionStatus.PENDING:
+            data = model_to_dict(ext_info)
+            data["status"] = self._pending.get(ext_info.name, (ExtensionStatus.INACTIVE, None))[0]
+            return data
+        
+        revision = self._revisions[ext_info.name]
+        entry = self._serialized.get(ext_info.name)
+        if entry is None or entry[0] is not ext_info or entry[1] != revision:
+            entry = self._serialized[ext_info.name] = (ext_info, revision, model_to_dict(ext_info))
+        return entry[2]
+    
+    def _touch(self, ext_info: ExtensionInfo) -> None:
+        """Mark an extension as modified in place."""
+        self._revisions[ext_info.name] += 1
+    
+    def _mark_pending(self, ext_info: ExtensionInfo, owner: Optional[object] = None) -> None:
+        """Mark an extension pending while its state changes.
+        
+        The status it had before is kept for _end_pending() and for saving;
+        marking an extension that is already pending keeps its original
+        status and takes the mark over. Call with the registry lock held.
+        
+        Args:
+            ext_info: The extension information.
+            owner: The enable_extension() call marking its whole activation
+                order, or None for a change that is running now.
+        """
+        previous_status = ext_info.status
+        if previous_status == ExtensionStatus.PENDING:
+            previous_status = self._pending.get(ext_info.name, (ExtensionStatus.INACTIVE, None))[0]
+        
+        self._pending[ext_info.name] = (previous_status, owner)
+        ext_info.status = ExtensionStatus.PENDING
+        # Not saved, but cached responses must not keep showing the old status
+        self._version += 1
+    
+    def _end_pending(self, ext_info: ExtensionInfo, status: Optional[ExtensionStatus] = None) -> None:
+        """End an extension's pending state, restoring its previous status unless another is given.
+        
+        Call with the registry lock held.
+        """
+        previous_status, _ = self._pending.pop(ext_info.name, (ExtensionStatus.INACTIVE, None))
+        ext_info.status = previous_status if status is None else status
+        self._version += 1
+    
     def discover(self) -> Dict[str, ExtensionInfo]:
         """Discover installed extensions.
         
         Returns:
             A dictionary mapping extension names to extension information.
         """
-        with self._lock:
-            # Get paths to potential extension modules
-            extension_paths = discover_extensions(self.extensions_dir)
+        # Taken before scanning, so changes made during the scan trigger another one
+        discovered_fingerprint = self._extensions_dir_fingerprint()
+        
+        # Get paths to potential extension modules
+        extension_paths = discover_extensions(self.extensions_dir)
+        
+        # Load extensions from paths; imports are mostly file I/O, so they run in threads
+        loaded_extensions = []
+        max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(extension_paths)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(load_extension, path) for path in extension_paths]
             
-            # Load extensions from paths
-            loaded_extensions = []
-            for path in extension_paths:
+            # Collect in discovery order, so later paths still win name clashes
+            for path, future in zip(extension_paths, futures):
                 try:
-                    extension = load_extension(path)
+                    extension = future.result()
                     if extension is not None:
-                        loaded_extensions.append(extension)
+                        loaded_extensions.append((extension, path))
                 except Exception as e:
                     logger.error(f"Error loading extension from {path}: {e}")
-            
-            # Update registry with loaded extensions
-            for ext in loaded_extensions:
-                ext_info = self._create_extension_info(ext, os.path.dirname(path))
+        
+        with self._lock:
+            # Update registry with loaded extensions, all stamped with the same time
+            now = datetime.datetime.now()
+            for ext, path in loaded_extensions:
+                ext_info = self._create_extension_info(ext, os.path.dirname(path), now)
                 # Update existing extension or add new one
-                self.extensions[ext.name] = ext_info
+                self._add_extension(ext_info)
                 self.instances[ext.name] = ext
             
             # Save the updated registry configuration
             self._save_config()
+            self._discovered_fingerprint = discovered_fingerprint
             
             return self.extensions
     
-    def _create_extension_info(self, extension: Extension, path: str) -> ExtensionInfo:
+    def _discover_if_changed(self) -> None:
+        """Run discover() unless the extensions directory is unchanged since the last scan.
+        
+        Keeps an empty registry from rescanning the directory on every call.
+        """
+        fingerprint = self._extensions_dir_fingerprint()
+        if self._discovered_fingerprint is None or fingerprint is None or fingerprint != self._discovered_fingerprint:
+            self.discover()
+    
+    def _extensions_dir_fingerprint(self) -> Optional[FrozenSet[Tuple[str, int]]]:
+        """Get the name and mtime of every directory discovery looks into, or None if they cannot be read.
+        
+        Only directories count: the registry configuration, its cache and
+        their temporary files usually live in the extensions directory too,
+        and writing them changes the directory's own mtime.
+        """
+        try:
+            with os.scandir(self.extensions_dir) as entries:
+                return frozenset(
+                    (entry.name, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".")
+                )
+        except OSError:
+            return None
+    
+    def invalidate_discovery(self) -> None:
+        """Make the next implicit discovery rescan the extensions directory."""
+        with self._lock:
+            self._discovered_fingerprint = None
+    
+    def _create_extension_info(self, extension: Extension, path: str, now: Optional[datetime.datetime] = None) -> ExtensionInfo:
         """Create extension information from an extension instance.
         
         Args:
             extension: The extension instance.
             path: The path to the extension.
+            now: The installation time to record; defaults to the current UTC time.
             
         Returns:
             The extension information.
         """
-        # Convert extension type to enum
-        ext_type = ExtensionType(extension.type)
+        if now is None:
+            now = datetime.datetime.now()
+        
+        # Convert extension type to enum; the Enum call only runs to reject unknown types
+        ext_type = _EXTENSION_TYPES.get(extension.type) or ExtensionType(extension.type)
         
         # Get extension status from registry or set to inactive
         status = ExtensionStatus.INACTIVE
         if extension.name in self.extensions:
             status = self.extensions[extension.name].status
+            if status == ExtensionStatus.PENDING:
+                status = self._pending.get(extension.name, (ExtensionStatus.INACTIVE, None))[0]
         
-        # Convert dependencies to proper format
-        dependencies = []
-        for dep in extension.dependencies:
-            # Handle simple string dependencies
-            if isinstance(dep, str):
-                dependencies.append(ExtensionDependency(name=dep))
-            # Handle dictionary dependencies with version info
-            elif isinstance(dep, dict) and "name" in dep:
-                dependencies.append(ExtensionDependency(**dep))
+        # Convert dependencies to proper format. Plain names cannot be invalid,
+        # so they skip validation; dictionaries from the extension are validated
+        dependencies = [
+            construct_model(ExtensionDependency, name=dep) if isinstance(dep, str) else ExtensionDependency(**dep)
+            for dep in extension.dependencies
+            if isinstance(dep, str) or (isinstance(dep, dict) and "name" in dep)
+        ]
         
         # Convert settings to proper format
-        settings = []
-        for key, value in extension.settings.items():
+        settings = [
             # Handle dictionary settings
-            if isinstance(value, dict) and "default" in value:
-                settings.append(ExtensionSetting(name=key, **value))
-            # Handle simple settings
-            else:
-                settings.append(ExtensionSetting(
-                    name=key,
-                    type=type(value).__name__ if value is not None else "str",
-                    default=value,
-                    value=value,
-                    description=f"Setting for {key}"
-                ))
+            ExtensionSetting(name=key, **value)
+            if isinstance(value, dict) and "default" in value
+            # Handle simple settings, whose fields are all derived here
+            else construct_model(
+                ExtensionSetting,
+                name=key,
+                type=type(value).__name__ if value is not None else "str",
+                default=value,
+                value=value,
+                description=f"Setting for {key}",
+            )
+            for key, value in extension.settings.items()
+        ]
         
         # Create extension info
         ext_info = ExtensionInfo(
@@ -204,12 +512,55 @@ class ExtensionRegistry:
             path=path,
             dependencies=dependencies,
             settings=settings,
-            installed_at=datetime.datetime.now(),
-            updated_at=datetime.datetime.now(),
+            installed_at=now,
+            updated_at=now,
         )
         
         return ext_info
     
+    def _add_extension(self, ext_info: ExtensionInfo) -> None:
+        """Add or replace an extension in the registry, keeping the indexes up to date."""
+        name = ext_info.name
+        if name in self.extensions:
+            self._remove_extension(name)
+        
+        self.extensions[name] = ext_info
+        self._sorted_names = None
+        # Joined with NUL so a search cannot match across field boundaries
+        self._search_index[name] = "\0".join((ext_info.name, ext_info.description, ext_info.author)).lower()
+        
+        dependencies = frozenset(dep.name for dep in ext_info.dependencies)
+        self._dependencies[name] = dependencies
+        for dep_name in dependencies:
+            if dep_name != name:
+                self._dependents[dep_name].add(name)
+    
+    def _remove_extension(self, name: str) -> None:
+        """Remove an extension from the registry, keeping the indexes up to date."""
+        del self.extensions[name]
+        self._sorted_names = None
+        self._search_index.pop(name, None)
+        self._serialized.pop(name, None)
+        self._revisions.pop(name, None)
+        self._pending.pop(name, None)
+        self._started.discard(name)
+        
+        for dep_name in self._dependencies.pop(name, ()):
+            dependents = self._dependents.get(dep_name)
+            if dependents is not None:
+                dependents.discard(name)
+                if not dependents:
+                    del self._dependents[dep_name]
+    
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever the registry's extensions change.
+        
+        Anything derived from the registry can be cached for as long as the
+        version stays the same.
+        """
+        return self._version
+    
     def get_extension_info(self, name: str) -> Optional[ExtensionInfo]:
         """Get information about an extension.
         
@@ -234,46 +585,88 @@ class ExtensionRegistry:
         with self._lock:
             return self.instances.get(name)
     
-    def list_extensions(self, filters: Optional[ExtensionFilters] = None) -> List[ExtensionInfo]:
-        """List all extensions.
+    def list_extensions(self, filters: Optional[ExtensionFilters] = None, offset: int = 0, limit: Optional[int] = None, after: Optional[str] = None, count_total: bool = True) -> Tuple[List[ExtensionInfo], Optional[int], bool]:
+        """List extensions in name order, one page at a time.
         
         Args:
             filters: Filters to apply to the list.
+            offset: The number of matching extensions to skip.
+            limit: The maximum number of extensions to return, or None for all.
+            after: Only list extensions whose names sort after this one; used
+                for cursor-based pagination.
+            count_total: Whether to count every match. Without it the scan
+                stops one match past the requested window.
             
         Returns:
-            A list of extension information.
+            A tuple containing:
+            - The extensions in the requested window.
+            - The total number of extensions matching the filters (after the
+              cursor, if one was given), or None if count_total is False.
+            - Whether more matching extensions follow the window.
         """
         with self._lock:
             # If no extensions in registry, discover them
             if not self.extensions:
-                self.discover()
+                self._discover_if_changed()
             
-            # Filter extensions based on criteria
-            extensions = list(self.extensions.values())
+            matches = self._filter_extensions(filters, after)
             
-            if filters:
-                # Filter by type
-                if filters.types:
-                    extensions = [ext for ext in extensions if ext.type in filters.types]
-                
-                # Filter by status
-                if filters.status:
-                    extensions = [ext for ext in extensions if ext.status in filters.status]
-                
-                # Filter by source
-                if filters.sources:
-                    extensions = [ext for ext in extensions if ext.source in filters.sources]
-                
-                # Filter by search query
-                if filters.search:
-                    search = filters.search.lower()
-                    extensions = [ext for ext in extensions if (
-                        search in ext.name.lower() or
-                        search in ext.description.lower() or
-                        search in ext.author.lower()
-                    )]
+            if not count_total:
+                # Fetch one extra match to find out whether another page follows
+                stop = None if limit is None else offset + limit + 1
+                page = list(islice(matches, offset, stop))
+                has_more = limit is not None and len(page) > limit
+                if has_more:
+                    del page[limit:]
+                return page, None, has_more
             
-            return extensions
+            # Count every match, but only keep the ones inside the window
+            page = []
+            total = 0
+            for ext in matches:
+                if total >= offset and (limit is None or len(page) < limit):
+                    page.append(ext)
+                total += 1
+            
+            return page, total, offset + len(page) < total
+    
+    def _sorted_extension_names(self) -> List[str]:
+        """Get the registered extension names in sorted order."""
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self.extensions)
+        return self._sorted_names
+    
+    def _filter_extensions(self, filters: Optional[ExtensionFilters], after: Optional[str] = None) -> Iterator[ExtensionInfo]:
+        """Lazily yield the registered extensions that match the filters, in name order.
+        
+        All filters are checked in a single pass, cheapest first, so an
+        extension is rejected as soon as one check fails.
+        """
+        # Jump straight past the cursor with a binary search
+        names = self._sorted_extension_names()
+        start = bisect_right(names, after) if after is not None else 0
+        extensions = self.extensions
+        search_index = self._search_index
+        
+        # Prepare the filters once per call
+        types = status = sources = search = None
+        if filters:
+            types = frozenset(filters.types) if filters.types else None
+            status = frozenset(filters.status) if filters.status else None
+            sources = frozenset(filters.sources) if filters.sources else None
+            search = filters.search.lower() if filters.search else None
+        
+        for i in range(start, len(names)):
+            ext = extensions[names[i]]
+            if status is not None and ext.status not in status:
+                continue
+            if types is not None and ext.type not in types:
+                continue
+            if sources is not None and ext.source not in sources:
+                continue
+            if search is not None and search not in search_index[ext.name]:
+                continue
+            yield ext
     
     def install_extension(self, source: ExtensionSource, url: Optional[str] = None, path: Optional[str] = None, name: Optional[str] = None) -> Tuple[bool, Optional[ExtensionInfo], str]:
         """Install an extension.
@@ -290,45 +683,47 @@ class ExtensionRegistry:
             - The extension information if successful, None otherwise.
             - A message describing the result.
         """
-        with self._lock:
-            try:
-                extension_path = None
-                
-                # Install from different sources
-                if source == ExtensionSource.REMOTE and url:
-                    extension_path = install_extension_from_url(url, self.extensions_dir)
-                elif source == ExtensionSource.LOCAL and path:
-                    extension_path = install_extension_from_directory(path, self.extensions_dir)
-                elif source == ExtensionSource.MARKETPLACE and name:
-                    # TODO: Implement marketplace extension installation
-                    return False, None, f"Marketplace installation not implemented yet"
-                else:
-                    return False, None, f"Invalid extension source or missing parameters"
-                
-                if not extension_path:
-                    return False, None, f"Failed to install extension"
-                
-                # Load the installed extension
-                init_path = os.path.join(extension_path, "__init__.py")
-                extension = load_extension(init_path)
-                
-                if not extension:
-                    return False, None, f"Failed to load installed extension"
-                
+        try:
+            extension_path = None
+            
+            # Install from different sources; downloading and copying files
+            # does not touch the registry, so it runs without the lock
+            if source == ExtensionSource.REMOTE and url:
+                extension_path = install_extension_from_url(url, self.extensions_dir)
+            elif source == ExtensionSource.LOCAL and path:
+                extension_path = install_extension_from_directory(path, self.extensions_dir)
+            elif source == ExtensionSource.MARKETPLACE and name:
+                # TODO: Implement marketplace extension installation
+                return False, None, f"Marketplace installation not implemented yet"
+            else:
+                return False, None, f"Invalid extension source or missing parameters"
+            
+            if not extension_path:
+                return False, None, f"Failed to install extension"
+            
+            # Load the installed extension
+            init_path = os.path.join(extension_path, "__init__.py")
+            extension = load_extension(init_path)
+            
+            if not extension:
+                return False, None, f"Failed to load installed extension"
+            
+            with self._lock:
                 # Create extension info
                 ext_info = self._create_extension_info(extension, extension_path)
                 
                 # Update registry
-                self.extensions[extension.name] = ext_info
+                self._add_extension(ext_info)
                 self.instances[extension.name] = extension
                 
-                # Save registry configuration
+                # Save registry configuration; the extensions directory changed
                 self._save_config()
-                
-                return True, ext_info, f"Extension {extension.name} installed successfully"
-            except Exception as e:
-                logger.error(f"Error installing extension: {e}")
-                return False, None, f"Error installing extension: {e}"
+                self._discovered_fingerprint = None
+            
+            return True, ext_info, f"Extension {extension.name} installed successfully"
+        except Exception as e:
+            logger.error(f"Error installing extension: {e}")
+            return False, None, f"Error installing extension: {e}"
     
     def uninstall_extension(self, name: str) -> Tuple[bool, str]:
         """Uninstall an extension.
@@ -341,24 +736,25 @@ class ExtensionRegistry:
             - A boolean indicating success or failure.
             - A message describing the result.
         """
-        with self._lock:
+        with self._lock_for(name):
             try:
-                # Check if extension exists
-                if name not in self.extensions:
-                    return False, f"Extension {name} not found"
-                
-                # Get extension info
-                ext_info = self.extensions[name]
+                with self._lock:
+                    # Check if extension exists
+                    if name not in self.extensions:
+                        return False, f"Extension {name} not found"
+                    
+                    # Get extension info
+                    ext_info = self.extensions[name]
+                    instance = self.instances.get(name)
                 
                 # Deactivate the extension if it's active
-                if ext_info.status == ExtensionStatus.ACTIVE and name in self.instances:
-                    instance = self.instances[name]
+                if ext_info.status == ExtensionStatus.ACTIVE and instance is not None:
                     instance.deactivate()
                 
                 # Remove extension from registry
-                del self.extensions[name]
-                if name in self.instances:
-                    del self.instances[name]
+                with self._lock:
+                    self._remove_extension(name)
+                    self.instances.pop(name, None)
                 
                 # Uninstall the extension
                 if ext_info.path:
@@ -366,100 +762,238 @@ class ExtensionRegistry:
                     if not success:
                         return False, f"Failed to uninstall extension {name}"
                 
-                # Save registry configuration
-                self._save_config()
+                # Save registry configuration; the extensions directory changed
+                with self._lock:
+                    self._save_config()
+                    self._discovered_fingerprint = None
                 
                 return True, f"Extension {name} uninstalled successfully"
             except Exception as e:
                 logger.error(f"Error uninstalling extension {name}: {e}")
                 return False, f"Error uninstalling extension: {e}"
     
-    def enable_extension(self, name: str) -> Tuple[bool, str]:
+    def enable_extension(self, name: str) -> Tuple[bool, Optional[ExtensionInfo], str]:
         """Enable an extension.
         
+        Inactive dependencies are enabled first, in dependency order.
+        
         Args:
             name: The name of the extension to enable.
             
         Returns:
             A tuple containing:
             - A boolean indicating success or failure.
+            - The extension information after the change, or None if the
+              extension was not found.
             - A message describing the result.
         """
-        with self._lock:
+        # Enabling dependencies saves the configuration once per extension
+        with self._batch():
             try:
-                # Check if extension exists
-                if name not in self.extensions:
-                    return False, f"Extension {name} not found"
-                
-                # Get extension info
-                ext_info = self.extensions[name]
-                
-                # Check if extension is already active
-                if ext_info.status == ExtensionStatus.ACTIVE:
-                    return True, f"Extension {name} is already active"
-                
-                # Load the extension if not already loaded
-                if name not in self.instances:
-                    if not ext_info.path:
-                        return False, f"Extension {name} has no path"
+                with self._lock:
+                    # Check if extension exists
+                    if name not in self.extensions:
+                        return False, None, f"Extension {name} not found"
                     
-                    init_path = os.path.join(ext_info.path, "__init__.py")
-                    extension = load_extension(init_path)
+                    # Get extension info
+                    ext_info = self.extensions[name]
                     
-                    if not extension:
-                        return False, f"Failed to load extension {name}"
+                    # Check if extension is already active
+                    if ext_info.status == ExtensionStatus.ACTIVE:
+                        return True, ext_info, f"Extension {name} is already active"
                     
-                    self.instances[name] = extension
-                
-                # Initialize and activate the extension
-                instance = self.instances[name]
-                
-                # Check dependencies
-                dependencies = self.get_extension_dependencies(name)
-                unresolved_deps = dependencies - set(self.extensions.keys())
+                    # Order the extension after the dependencies it needs enabled
+                    try:
+                        order = self._activation_order([name])
+                    except ValueError as e:
+                        return False, ext_info, str(e)
+                    
+                    # Mark the whole order pending before releasing the lock, so
+                    # that its active dependencies cannot be disabled meanwhile
+                    owner = object()
+                    for ext_name in order:
+                        if self.extensions[ext_name].status != ExtensionStatus.ACTIVE:
+                            self._mark_pending(self.extensions[ext_name], owner)
                 
-                if unresolved_deps:
-                    return False, f"Extension {name} has unresolved dependencies: {', '.join(unresolved_deps)}"
+                try:
+                    for ext_name in order:
+                        success, message = self._activate_extension(ext_name)
+                        if not success:
+                            if ext_name != name:
+                                message = f"Failed to enable dependency {ext_name}: {message}"
+                            return False, ext_info, message
+                finally:
+                    # Give back the extensions this call marked but never got to
+                    with self._lock:
+                        for ext_name in order:
+                            pending = self._pending.get(ext_name)
+                            if pending is not None and pending[1] is owner:
+                                self._end_pending(self.extensions[ext_name])
                 
-                # Ensure all dependencies are active
-                for dep_name in dependencies:
-                    if dep_name in self.extensions:
-                        dep_info = self.extensions[dep_name]
-                        if dep_info.status != ExtensionStatus.ACTIVE:
-                            # Try to enable the dependency
-                            success, message = self.enable_extension(dep_name)
-                            if not success:
-                                return False, f"Failed to enable dependency {dep_name}: {message}"
+                return True, ext_info, f"Extension {name} enabled successfully"
+            except Exception as e:
+                logger.error(f"Error enabling extension {name}: {e}")
+                return False, self.get_extension_info(name), f"Error enabling extension: {e}"
+    
+    def _activation_order(self, roots: List[str]) -> List[str]:
+        """Order extensions after the dependencies they need enabled (Kahn's algorithm).
+        
+        Dependencies are followed transitively, except through extensions
+        that are already active.
+        
+        Args:
+            roots: The names of the extensions to enable.
+            
+        Returns:
+            The roots and their dependencies, each after its own dependencies.
+            
+        Raises:
+            ValueError: If a dependency is not registered, or dependencies
+                form a cycle.
+        """
+        # Collect the dependency closure of the roots
+        dependencies: Dict[str, Set[str]] = {}
+        pending = deque(roots)
+        root_names = set(roots)
+        while pending:
+            ext_name = pending.popleft()
+            if ext_name in dependencies:
+                continue
+            
+            if ext_name not in root_names and self.extensions[ext_name].status == ExtensionStatus.ACTIVE:
+                dependencies[ext_name] = set()
+                continue
+            
+            deps = self.get_extension_dependencies(ext_name)
+            unresolved_deps = deps - self.extensions.keys()
+            if unresolved_deps:
+                raise ValueError(f"Extension {ext_name} has unresolved dependencies: {', '.join(unresolved_deps)}")
+            
+            dependencies[ext_name] = deps
+            pending.extend(deps)
+        
+        # Emit each extension once all of its dependencies have been emitted
+        in_degree = {ext_name: len(deps) for ext_name, deps in dependencies.items()}
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for ext_name, deps in dependencies.items():
+            for dep_name in deps:
+                dependents[dep_name].append(ext_name)
+        
+        ready = deque(ext_name for ext_name, degree in in_degree.items() if degree == 0)
+        order = []
+        while ready:
+            ext_name = ready.popleft()
+            order.append(ext_name)
+            for dependent in dependents[ext_name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(order) < len(dependencies):
+            # Left over are the cycles and the extensions that depend on them;
+            # peel off the latter, starting with those nothing left depends on
+            remaining = {ext_name for ext_name, degree in in_degree.items() if degree}
+            dependent_count = {
+                ext_name: sum(1 for dependent in dependents[ext_name] if dependent in remaining)
+                for ext_name in remaining
+            }
+            unneeded = deque(ext_name for ext_name, count in dependent_count.items() if count == 0)
+            while unneeded:
+                ext_name = unneeded.popleft()
+                remaining.discard(ext_name)
+                for dep_name in dependencies[ext_name]:
+                    if dep_name in remaining:
+                        dependent_count[dep_name] -= 1
+                        if dependent_count[dep_name] == 0:
+                            unneeded.append(dep_name)
+            
+            cycle = sorted(remaining)
+            raise ValueError(f"Circular dependencies between extensions: {', '.join(cycle)}")
+        
+        return order
+    
+    def _activate_extension(self, name: str, startup: bool = False) -> Tuple[bool, str]:
+        """Load, initialize and activate a single extension, ignoring its dependencies.
+        
+        The extension is marked pending while its code runs, outside the
+        registry lock, so it is not mistaken for active or inactive.
+        
+        Args:
+            name: The name of the extension to activate.
+            startup: Whether to start an extension saved as active that this
+                process has not started yet. A failure to start it is
+                recorded as an error rather than restoring the active status.
+            
+        Returns:
+            A tuple containing:
+            - A boolean indicating success or failure.
+            - A message describing the result.
+        """
+        with self._lock_for(name):
+            with self._lock:
+                ext_info = self.extensions.get(name)
+                if ext_info is None:
+                    return False, f"Extension {name} not found"
+                if ext_info.status == ExtensionStatus.ACTIVE and not (startup and name not in self._started):
+                    return True, f"Extension {name} is already active"
                 
-                # Initialize and activate the extension
-                try:
-                    success = instance.initialize({})
-                    if not success:
-                        return False, f"Failed to initialize extension {name}"
-                    
-                    success = instance.activate()
-                    if not success:
-                        return False, f"Failed to activate extension {name}"
-                    
-                    # Update extension status
-                    ext_info.status = ExtensionStatus.ACTIVE
-                    ext_info.error = None
-                    
-                    # Save registry configuration
-                    self._save_config()
-                    
-                    return True, f"Extension {name} enabled successfully"
-                except Exception as e:
-                    logger.error(f"Error enabling extension {name}: {e}")
-                    ext_info.status = ExtensionStatus.ERROR
-                    ext_info.error = str(e)
-                    self._save_config()
-                    return False, f"Error enabling extension: {e}"
+                instance = self.instances.get(name)
+                self._mark_pending(ext_info)
+            
+            error = None
+            try:
+                success, message = self._start_extension(name, ext_info, instance)
             except Exception as e:
                 logger.error(f"Error enabling extension {name}: {e}")
-                return False, f"Error enabling extension: {e}"
+                success, message, error = False, f"Error enabling extension: {e}", str(e)
+            
+            with self._lock:
+                # Update extension status
+                if success:
+                    self._end_pending(ext_info, ExtensionStatus.ACTIVE)
+                    self._started.add(name)
+                    ext_info.error = None
+                elif error is not None or startup:
+                    self._end_pending(ext_info, ExtensionStatus.ERROR)
+                    ext_info.error = error or message
+                else:
+                    self._end_pending(ext_info)
+                    return False, message
+                self._touch(ext_info)
+                
+                # Save registry configuration
+                self._save_config()
+            
+            return success, message
     
-    def disable_extension(self, name: str) -> Tuple[bool, str]:
+    def _start_extension(self, name: str, ext_info: ExtensionInfo, instance: Optional[Extension]) -> Tuple[bool, str]:
+        """Run an extension's initialize() and activate(), loading it first if needed."""
+        # Load the extension if not already loaded
+        if instance is None:
+            if not ext_info.path:
+                return False, f"Extension {name} has no path"
+            
+            init_path = os.path.join(ext_info.path, "__init__.py")
+            extension = load_extension(init_path)
+            
+            if not extension:
+                return False, f"Failed to load extension {name}"
+            
+            with self._lock:
+                instance = self.instances.setdefault(name, extension)
+        
+        # Initialize and activate the extension
+        success = instance.initialize({})
+        if not success:
+            return False, f"Failed to initialize extension {name}"
+        
+        success = instance.activate()
+        if not success:
+            return False, f"Failed to activate extension {name}"
+        
+        return True, f"Extension {name} enabled successfully"
+    
+    def disable_extension(self, name: str) -> Tuple[bool, Optional[ExtensionInfo], str]:
         """Disable an extension.
         
         Args:
@@ -468,52 +1002,68 @@ class ExtensionRegistry:
         Returns:
             A tuple containing:
             - A boolean indicating success or failure.
+            - The extension information after the change, or None if the
+              extension was not found.
             - A message describing the result.
         """
-        with self._lock:
+        with self._lock_for(name):
             try:
-                # Check if extension exists
-                if name not in self.extensions:
-                    return False, f"Extension {name} not found"
-                
-                # Get extension info
-                ext_info = self.extensions[name]
-                
-                # Check if extension is already inactive
-                if ext_info.status != ExtensionStatus.ACTIVE:
-                    return True, f"Extension {name} is already inactive"
-                
-                # Check if other active extensions depend on this one
-                dependents = self.get_extension_dependents(name)
-                active_dependents = [dep for dep in dependents if self.extensions.get(dep, {}).status == ExtensionStatus.ACTIVE]
-                
-                if active_dependents:
-                    return False, f"Extension {name} cannot be disabled because it is required by: {', '.join(active_dependents)}"
+                with self._lock:
+                    # Check if extension exists
+                    if name not in self.extensions:
+                        return False, None, f"Extension {name} not found"
+                    
+                    # Get extension info
+                    ext_info = self.extensions[name]
+                    
+                    # Check if extension is already inactive
+                    if ext_info.status != ExtensionStatus.ACTIVE:
+                        return True, ext_info, f"Extension {name} is already inactive"
+                    
+                    # Check if other extensions depend on this one, counting
+                    # those that are being enabled right now
+                    active_dependents = sorted(
+                        dep_name for dep_name in self._dependents.get(name, ())
+                        if dep_name in self.extensions
+                        and self.extensions[dep_name].status in (ExtensionStatus.ACTIVE, ExtensionStatus.PENDING)
+                    )
+                    
+                    if active_dependents:
+                        return False, ext_info, f"Extension {name} cannot be disabled because it is required by: {', '.join(active_dependents)}"
+                    
+                    instance = self.instances.get(name)
+                    self._mark_pending(ext_info)
                 
                 # Deactivate the extension
-                if name in self.instances:
-                    instance = self.instances[name]
-                    
+                error = None
+                if instance is not None:
                     try:
                         success = instance.deactivate()
                         if not success:
-                            return False, f"Failed to deactivate extension {name}"
+                            with self._lock:
+                                self._end_pending(ext_info)
+                            return False, ext_info, f"Failed to deactivate extension {name}"
                     except Exception as e:
                         logger.error(f"Error deactivating extension {name}: {e}")
-                        ext_info.error = str(e)
-                
-                # Update extension status
-                ext_info.status = ExtensionStatus.INACTIVE
+                        error = str(e)
                 
-                # Save registry configuration
-                self._save_config()
+                with self._lock:
+                    # Update extension status
+                    if error is not None:
+                        ext_info.error = error
+                    self._end_pending(ext_info, ExtensionStatus.INACTIVE)
+                    self._started.discard(name)
+                    self._touch(ext_info)
+                    
+                    # Save registry configuration
+                    self._save_config()
                 
-                return True, f"Extension {name} disabled successfully"
+                return True, ext_info, f"Extension {name} disabled successfully"
             except Exception as e:
                 logger.error(f"Error disabling extension {name}: {e}")
-                return False, f"Error disabling extension: {e}"
+                return False, self.get_extension_info(name), f"Error disabling extension: {e}"
     
-    def update_extension_settings(self, name: str, settings: Dict[str, Any]) -> Tuple[bool, str]:
+    def update_extension_settings(self, name: str, settings: Dict[str, Any]) -> Tuple[bool, Optional[ExtensionInfo], str]:
         """Update extension settings.
         
         Args:
@@ -523,13 +1073,15 @@ class ExtensionRegistry:
         Returns:
             A tuple containing:
             - A boolean indicating success or failure.
+            - The extension information after the change, or None if the
+              extension was not found.
             - A message describing the result.
         """
         with self._lock:
             try:
                 # Check if extension exists
                 if name not in self.extensions:
-                    return False, f"Extension {name} not found"
+                    return False, None, f"Extension {name} not found"
                 
                 # Get extension info
                 ext_info = self.extensions[name]
@@ -538,6 +1090,7 @@ class ExtensionRegistry:
                 for setting in ext_info.settings:
                     if setting.name in settings:
                         setting.value = settings[setting.name]
+                self._touch(ext_info)
                 
                 # Save registry configuration
                 self._save_config()
@@ -549,10 +1102,10 @@ class ExtensionRegistry:
                         if hasattr(instance, key):
                             setattr(instance, key, value)
                 
-                return True, f"Extension {name} settings updated successfully"
+                return True, ext_info, f"Extension {name} settings updated successfully"
             except Exception as e:
                 logger.error(f"Error updating extension settings: {e}")
-                return False, f"Error updating extension settings: {e}"
+                return False, self.extensions.get(name), f"Error updating extension settings: {e}"
     
     def get_extension_dependencies(self, name: str) -> Set[str]:
         """Get the names of all extensions that the given extension depends on.
@@ -564,11 +1117,7 @@ class ExtensionRegistry:
             A set of extension names.
         """
         with self._lock:
-            if name not in self.extensions:
-                return set()
-            
-            ext_info = self.extensions[name]
-            return {dep.name for dep in ext_info.dependencies}
+            return set(self._dependencies.get(name, ()))
     
     def get_extension_dependents(self, name: str) -> Set[str]:
         """Get the names of all extensions that depend on the given extension.
@@ -580,35 +1129,103 @@ class ExtensionRegistry:
             A set of extension names.
         """
         with self._lock:
-            dependents = set()
-            for ext_name, ext_info in self.extensions.items():
-                if ext_name != name:
-                    for dep in ext_info.dependencies:
-                        if dep.name == name:
-                            dependents.add(ext_name)
-            return dependents
+            return set(self._dependents.get(name, ()))
     
     def initialize_all(self) -> Dict[str, Tuple[bool, str]]:
         """Initialize all extensions.
         
+        Extensions saved as active are started in dependency order; one whose
+        dependency failed to start is not started.
+        
         Returns:
             A dictionary mapping extension names to initialization results.
         """
         with self._lock:
             # If no extensions in registry, discover them
             if not self.extensions:
-                self.discover()
+                self._discover_if_changed()
             
             # Get extensions that should be active
             active_extensions = [name for name, info in self.extensions.items() if info.status == ExtensionStatus.ACTIVE]
             
             # Initialize extensions in dependency order
-            results = {}
-            for name in active_extensions:
-                success, message = self.enable_extension(name)
+            try:
+                order = self._activation_order(active_extensions)
+            except ValueError as e:
+                logger.error(f"Cannot order extensions for initialization: {e}")
+                order = active_extensions
+        
+        # Extension code runs without the registry lock; the configuration is saved once
+        active_names = set(active_extensions)
+        results = {}
+        failed: Set[str] = set()
+        with self._batch():
+            for name in order:
+                if name not in active_names:
+                    continue
+                
+                failed_deps = sorted(self.get_extension_dependencies(name) & failed)
+                if failed_deps:
+                    success, message = False, f"Extension {name} was not started because its dependencies failed: {', '.join(failed_deps)}"
+                else:
+                    success, message = self._activate_extension(name, startup=True)
+                
+                if not success:
+                    failed.add(name)
                 results[name] = (success, message)
+        
+        return results
+    
+    async def initialize_all_async(self, max_workers: Optional[int] = None) -> Dict[str, Tuple[bool, str]]:
+        """Initialize all extensions, importing their modules concurrently.
+        
+        Importing extension modules is the slow part of initialization and
+        does not touch registry state, so the modules of all active extensions
+        are loaded in worker threads first. The extensions are then initialized
+        by initialize_all(), which keeps dependency order.
+        
+        Args:
+            max_workers: The maximum number of modules imported at once.
+                Defaults to four per CPU, capped at 32.
             
-            return results
+        Returns:
+            A dictionary mapping extension names to initialization results.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_workers or min(32, (os.cpu_count() or 1) * 4))
+        
+        async def preload(name: str, init_path: str) -> None:
+            async with semaphore:
+                await loop.run_in_executor(None, self._preload_instance, name, init_path)
+        
+        pending = await loop.run_in_executor(None, self._pending_instance_paths)
+        await asyncio.gather(*(preload(name, init_path) for name, init_path in pending))
+        
+        return await loop.run_in_executor(None, self.initialize_all)
+    
+    def _pending_instance_paths(self) -> List[Tuple[str, str]]:
+        """Get the names and module paths of active extensions that are not loaded yet."""
+        with self._lock:
+            if not self.extensions:
+                self._discover_if_changed()
+            
+            return [
+                (name, os.path.join(info.path, "__init__.py"))
+                for name, info in self.extensions.items()
+                if info.status == ExtensionStatus.ACTIVE and info.path and name not in self.instances
+            ]
+    
+    def _preload_instance(self, name: str, init_path: str) -> None:
+        """Load an extension's module and keep the instance for initialization."""
+        try:
+            extension = load_extension(init_path)
+        except Exception as e:
+            logger.error(f"Error loading extension {name}: {e}")
+            return
+        
+        if extension is not None:
+            with self._lock:
+                self.instances.setdefault(name, extension)
 
 # Singleton instance for easy access
 registry = ExtensionRegistry()
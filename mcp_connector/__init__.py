@@ -16,12 +16,15 @@ tags: [mcp, models, ai, llm]
 
 import os
 import sys
+import hashlib
 import logging
 from fastapi import APIRouter, FastAPI
+from starlette.datastructures import Headers
+from starlette.responses import Response
 from starlette.staticfiles import StaticFiles
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from extension_framework.serialization import default_response_class
+
 logger = logging.getLogger("mcp_connector")
 
 # Extension metadata
@@ -35,7 +38,104 @@ __license__ = "MIT"
 __tags__ = ["mcp", "models", "ai", "llm"]
 
 # Create router
-router = APIRouter(prefix="/api/ext/mcp_connector", tags=["mcp_connector"])
+router = APIRouter(prefix="/api/ext/mcp_connector", tags=["mcp_connector"], default_response_class=default_response_class())
+
+# Script tag injected into HTML pages, encoded once at import time.
+# Replaced at startup with the content-hashed URL of the manager script.
+STATIC_URL = "/extensions/mcp_connector/static"
+SCRIPT_TAG_BYTES = f'<script src="{STATIC_URL}/mcp_manager.js"></script></body>'.encode()
+BODY_CLOSE_TAG = b"</body>"
+
+# Requests under these prefixes never return pages the script belongs in
+_PASSTHROUGH_PREFIXES = ("/api/", STATIC_URL + "/")
+
+# Static assets directory, resolved once at import time (None if absent)
+_STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+if not os.path.isdir(_STATIC_DIR):
+    _STATIC_DIR = None
+
+class MCPScriptMiddleware:
+    """ASGI middleware that injects the MCP manager script into HTML pages.
+    
+    API and static asset requests are passed straight through without
+    wrapping ``send``, and non-HTML responses are forwarded untouched. HTML
+    bodies are streamed as they arrive; only the bytes from the last
+    ``</body>`` seen so far (or a possible partial tag) are held back until
+    the final body message, where the script tag is spliced in.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(_PASSTHROUGH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        
+        is_html = False
+        carry = b""
+        
+        async def send_wrapper(message):
+            nonlocal is_html, carry
+            
+            if message["type"] == "http.response.start":
+                # ASGI header names are lowercase bytes, so scan the raw list directly
+                raw_headers = message["headers"]
+                for key, value in raw_headers:
+                    if key == b"content-type":
+                        is_html = value.startswith(b"text/html")
+                        break
+                
+                if is_html:
+                    # The body grows, so let the server use chunked encoding
+                    message["headers"] = [(key, value) for key, value in raw_headers if key != b"content-length"]
+                await send(message)
+                return
+            
+            if not is_html or message["type"] != "http.response.body":
+                await send(message)
+                return
+            
+            chunk = carry + message.get("body", b"")
+            index = chunk.rfind(BODY_CLOSE_TAG)
+            
+            if message.get("more_body", False):
+                if index == -1:
+                    # Keep enough bytes to match a tag split across chunks
+                    index = max(len(chunk) - len(BODY_CLOSE_TAG) + 1, 0)
+                carry = chunk[index:]
+                if index:
+                    await send({"type": "http.response.body", "body": chunk[:index], "more_body": True})
+                return
+            
+            # Add our script before </body>
+            if index != -1:
+                chunk = chunk[:index] + SCRIPT_TAG_BYTES + chunk[index + len(BODY_CLOSE_TAG):]
+            carry = b""
+            await send({"type": "http.response.body", "body": chunk, "more_body": False})
+        
+        await self.app(scope, receive, send_wrapper)
+
+class CachingStaticFiles(StaticFiles):
+    """StaticFiles that supports conditional requests via a weak ETag.
+    
+    The ETag is derived from the file's mtime and size, so a matching
+    ``If-None-Match`` is answered with a 304 without opening the file.
+    """
+    
+    cache_control = "public, max-age=3600"
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        etag = f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers.update(headers)
+        return response
 
 def get_router():
     """Get the extension's API router."""
@@ -47,45 +147,54 @@ def get_router():
     
     return router
 
+def add_hashed_script_route(app: FastAPI, script_path: str) -> str:
+    """Serve a script under a content-hashed URL with an immutable cache policy.
+    
+    Args:
+        app: The FastAPI application.
+        script_path: The path to the script file.
+        
+    Returns:
+        The URL the script is served from.
+    """
+    with open(script_path, "rb") as f:
+        content = f.read()
+    
+    digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+    stem, ext = os.path.splitext(os.path.basename(script_path))
+    url = f"{STATIC_URL}/{stem}.{digest}{ext}"
+    headers = {
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "ETag": f'"{digest}"',
+    }
+    
+    async def hashed_script():
+        return Response(content, media_type="application/javascript", headers=headers)
+    
+    app.add_api_route(url, hashed_script, methods=["GET"], include_in_schema=False)
+    return url
+
 def on_startup(app: FastAPI):
     """Called when the extension starts up."""
+    global SCRIPT_TAG_BYTES
     logger.info("MCP Connector is starting up")
     
     # Register static files
-    static_dir = os.path.join(os.path.dirname(__file__), "static")
-    if os.path.exists(static_dir):
+    if _STATIC_DIR is not None:
+        # The hashed route must be registered before the mount shadows it
+        script_path = os.path.join(_STATIC_DIR, "mcp_manager.js")
+        if os.path.exists(script_path):
+            script_url = add_hashed_script_route(app, script_path)
+            SCRIPT_TAG_BYTES = f'<script src="{script_url}"></script></body>'.encode()
+            logger.info("Serving MCP manager script at %s", script_url)
+        
         app.mount(
-            "/extensions/mcp_connector/static",
-            StaticFiles(directory=static_dir),
+            STATIC_URL,
+            CachingStaticFiles(directory=_STATIC_DIR),
             name="mcp_connector_static"
         )
         
-        logger.info(f"Mounted static files at /extensions/mcp_connector/static")
+        logger.info("Mounted static files at %s", STATIC_URL)
     
     # Add script to inject UI components
-    @app.middleware("http")
-    async def add_mcp_script(request, call_next):
-        response = await call_next(request)
-        
-        # Only modify HTML responses for non-API requests
-        if (response.headers.get("content-type", "").startswith("text/html") and
-            not request.url.path.startswith("/api/")):
-            # Get response body
-            body = b""
-            async for chunk in response.body_iterator:
-                body += chunk
-            
-            # Add our script before </body>
-            script_tag = f'<script src="/extensions/mcp_connector/static/mcp_manager.js"></script></body>'
-            modified_body = body.replace(b"</body>", script_tag.encode())
-            
-            # Create new response with modified body
-            from starlette.responses import Response
-            return Response(
-                content=modified_body,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.media_type
-            )
-        
-        return response
+    app.add_middleware(MCPScriptMiddleware)
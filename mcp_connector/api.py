@@ -8,8 +8,6 @@ from fastapi import APIRouter, HTTPException
 
 from .mcp_client import MCPServerManager, MCPServerConfig
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp_connector.api")
 
 # Initialize server manager
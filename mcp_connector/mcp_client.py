@@ -3,16 +3,39 @@ MCP Client module for interacting with MCP (Model Context Protocol) servers.
 """
 
 import os
-import json
+import mmap
 import logging
 import aiohttp
 from typing import Dict, List, Any, Optional, Union
 from pydantic import BaseModel
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from extension_framework.serialization import HAS_ORJSON, json_dumps, json_loads
+
+# Files larger than this are parsed straight from a memory map
+_MMAP_THRESHOLD = 16 * 1024
+
+def _read_json_file(path: str) -> Any:
+    """Read and parse a JSON file.
+    
+    Small files are read with a plain read(); larger ones are memory-mapped and
+    parsed by orjson without an intermediate copy.
+    """
+    with open(path, "rb") as f:
+        if not HAS_ORJSON or os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            return json_loads(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return json_loads(view)
+
 logger = logging.getLogger("mcp_connector.client")
 
+# Configuration directory inside the extension, resolved once at import time
+_CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config")
+
+# Pydantic 2 renamed copy() to model_copy()
+_PYDANTIC_V2 = hasattr(BaseModel, "model_copy")
+
 class MCPServerConfig(BaseModel):
     """Configuration for an MCP server."""
     name: str
@@ -24,6 +47,8 @@ class MCPServerConfig(BaseModel):
 class MCPClient:
     """Client for interacting with MCP servers."""
     
+    __slots__ = ("server_url", "api_key", "timeout")
+    
     def __init__(self, server_url: str, api_key: str = "", timeout: int = 30):
         """Initialize the MCP client."""
         self.server_url = server_url.rstrip("/")
@@ -77,58 +102,84 @@ class MCPServerManager:
         self.config_dir = self._get_config_dir()
         self.config_file = os.path.join(self.config_dir, "servers.json")
         self.servers: Dict[str, MCPServerConfig] = {}
+        # Server name -> key in self.servers
+        self._keys_by_name: Dict[str, str] = {}
+        # (mtime_ns, size) of the config file as last read or written
+        self._config_stat: Optional[tuple] = None
         
         # Create the config directory if it doesn't exist
-        os.makedirs(self.config_dir, exist_ok=True)
+        if not os.path.isdir(self.config_dir):
+            os.makedirs(self.config_dir, exist_ok=True)
         
         # Load server configurations
         self.load_servers()
     
     def _get_config_dir(self) -> str:
         """Get the directory for configuration files."""
-        # Get the extension directory
-        extension_dir = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(extension_dir, "config")
+        return _CONFIG_DIR
+    
+    def _default_servers(self) -> Dict[str, MCPServerConfig]:
+        """Get the default server configurations, with a single example server."""
+        return {
+            "example": MCPServerConfig(
+                name="Example MCP Server",
+                url="http://localhost:11434/v1",
+                api_key="",
+                description="Example MCP server. Replace with your own server.",
+                enabled=False
+            )
+        }
     
     def load_servers(self) -> List[MCPServerConfig]:
-        """Load server configurations from the config file."""
-        if not os.path.exists(self.config_file):
-            # Create a default config with an example server
-            self.servers = {
-                "example": MCPServerConfig(
-                    name="Example MCP Server",
-                    url="http://localhost:11434/v1",
-                    api_key="",
-                    description="Example MCP server. Replace with your own server.",
-                    enabled=False
-                )
-            }
-            self._save_servers()
+        """Load server configurations from the config file.
         
+        The file is only parsed again when its mtime or size has changed since
+        it was last read or written by this manager. The returned servers are
+        copies, so changing them does not change the cached configuration.
+        """
         try:
-            with open(self.config_file, "r") as f:
-                servers_data = json.load(f)
-                
-                self.servers = {}
-                for key, data in servers_data.items():
-                    self.servers[key] = MCPServerConfig(**data)
+            config_stat = self._stat_config()
+            if config_stat is not None and config_stat == self._config_stat:
+                return self._copy_servers()
+            
+            servers_data = _read_json_file(self.config_file)
+            self._config_stat = config_stat
+            
+            self.servers = {}
+            for key, data in servers_data.items():
+                self.servers[key] = MCPServerConfig(**data)
+        except FileNotFoundError:
+            # Create a default config with an example server
+            self.servers = self._default_servers()
+            self._save_servers()
         except Exception as e:
             logger.error(f"Error loading server configurations: {str(e)}")
             
             # Create default config if loading fails
             if not self.servers:
-                self.servers = {
-                    "example": MCPServerConfig(
-                        name="Example MCP Server",
-                        url="http://localhost:11434/v1",
-                        api_key="",
-                        description="Example MCP server. Replace with your own server.",
-                        enabled=False
-                    )
-                }
+                self.servers = self._default_servers()
                 self._save_servers()
         
-        return list(self.servers.values())
+        self._reindex()
+        return self._copy_servers()
+    
+    def _copy_servers(self) -> List[MCPServerConfig]:
+        """Copy the cached server configurations."""
+        return [server.model_copy() if _PYDANTIC_V2 else server.copy() for server in self.servers.values()]
+    
+    def _stat_config(self) -> Optional[tuple]:
+        """Get the (mtime_ns, size) of the config file, or None if it does not exist."""
+        try:
+            stat_result = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+    
+    def _reindex(self) -> None:
+        """Rebuild the index of server names to config keys."""
+        self._keys_by_name = {}
+        for key, server in self.servers.items():
+            self._keys_by_name.setdefault(server.name, key)
     
     def _save_servers(self) -> bool:
         """Save server configurations to the config file."""
@@ -137,9 +188,11 @@ class MCPServerManager:
             for key, server in self.servers.items():
                 servers_data[key] = server.dict()
             
-            with open(self.config_file, "w") as f:
-                json.dump(servers_data, f, indent=2)
+            with open(self.config_file, "wb") as f:
+                f.write(json_dumps(servers_data))
             
+            # Our own write should not force a reparse on the next load
+            self._config_stat = self._stat_config()
             return True
         except Exception as e:
             logger.error(f"Error saving server configurations: {str(e)}")
@@ -147,10 +200,10 @@ class MCPServerManager:
     
     def get_server(self, server_name: str) -> Optional[MCPServerConfig]:
         """Get a server configuration by name."""
-        for key, server in self.servers.items():
-            if server.name == server_name:
-                return server
-        return None
+        key = self._keys_by_name.get(server_name)
+        if key is None:
+            return None
+        return self.servers[key]
     
     def add_server(self, server: MCPServerConfig) -> bool:
         """Add a new server configuration."""
@@ -163,6 +216,7 @@ class MCPServerManager:
         
         # Add the server
         self.servers[key] = server
+        self._reindex()
         
         # Save the servers
         return self._save_servers()
@@ -170,12 +224,7 @@ class MCPServerManager:
     def update_server(self, server_name: str, server: MCPServerConfig) -> bool:
         """Update an existing server configuration."""
         # Find the server
-        old_key = None
-        for key, s in self.servers.items():
-            if s.name == server_name:
-                old_key = key
-                break
-        
+        old_key = self._keys_by_name.get(server_name)
         if old_key is None:
             return False
         
@@ -195,6 +244,7 @@ class MCPServerManager:
         
         # Update the server
         self.servers[key] = server
+        self._reindex()
         
         # Save the servers
         return self._save_servers()
@@ -202,17 +252,13 @@ class MCPServerManager:
     def remove_server(self, server_name: str) -> bool:
         """Remove a server configuration."""
         # Find the server
-        key = None
-        for k, server in self.servers.items():
-            if server.name == server_name:
-                key = k
-                break
-        
+        key = self._keys_by_name.get(server_name)
         if key is None:
             return False
         
         # Remove the server
         del self.servers[key]
+        self._reindex()
         
         # Save the servers
         return self._save_servers()
@@ -19,6 +19,6 @@ from .extension_system.decorators import (
 )
 from .extension_system.hooks import hook_manager
 from .extension_system.registry import extension_registry
-from .plugin import on_startup, on_shutdown
+from .plugin import on_startup, on_shutdown, lifespan
 
 __version__ = "0.1.0"
@@ -1,5 +1,6 @@
 import uvicorn
 from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -11,13 +12,17 @@ import asyncio
 from .extension_system.registry import extension_registry
 from .manager.api import create_extension_router
 from .manager.ui import ui_router
+from .plugin import extensions_lifespan
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("open_webui_extensions")
 
 # Create FastAPI app
-app = FastAPI(title="Open WebUI Extension Development Server")
+app = FastAPI(title="Open WebUI Extension Development Server", lifespan=extensions_lifespan)
+
+# Compress JSON/HTML responses of 1 KiB or more
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Add extension API routes
 api_router = create_extension_router()
@@ -151,35 +156,6 @@ async def root(request: Request):
     
     return HTMLResponse(content=html)
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the extension system when the development server starts."""
-    # Load all extensions
-    extension_registry.load_all_extensions()
-    
-    # Call startup hooks for enabled extensions
-    for extension_id, extension in extension_registry.get_all_extensions().items():
-        if extension.enabled:
-            try:
-                await extension.on_startup()
-            except Exception as e:
-                logger.error(f"Error starting extension {extension_id}: {str(e)}")
-    
-    logger.info("Extension system initialized")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up the extension system when the development server shuts down."""
-    # Call shutdown hooks for enabled extensions
-    for extension_id, extension in extension_registry.get_all_extensions().items():
-        if extension.enabled:
-            try:
-                await extension.on_shutdown()
-            except Exception as e:
-                logger.error(f"Error shutting down extension {extension_id}: {str(e)}")
-    
-    logger.info("Extension system shut down")
-
 def run_dev_server():
     """Run the development server."""
     uvicorn.run("open_webui_extensions.dev_server:app", host="0.0.0.0", port=8000, reload=True)
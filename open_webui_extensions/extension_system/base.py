@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional, Any, Callable, Type
+from typing import AsyncIterator, Dict, List, Optional, Any, Callable, Type
+from contextlib import asynccontextmanager
 import importlib
 import inspect
 import os
@@ -57,6 +58,37 @@ class Extension:
         for hook in self.hooks.get('on_shutdown', []):
             await hook()
     
+    @asynccontextmanager
+    async def lifespan(self, app) -> AsyncIterator[None]:
+        """Run the extension for the lifetime of the application.
+        
+        The default implementation wraps on_startup() and on_shutdown(); extensions
+        that hold resources across the app's lifetime can override it instead.
+        """
+        await self.on_startup()
+        try:
+            yield
+        finally:
+            await self.on_shutdown()
+    
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get the extension's static metadata.
+        
+        The dictionary is built once per extension id and reused, so callers
+        must copy it before modifying it.
+        """
+        metadata = self.__dict__.get("_metadata")
+        if metadata is None or metadata["id"] != self.id:
+            metadata = {
+                "id": self.id,
+                "name": getattr(self, "name", self.id),
+                "description": getattr(self, "description", ""),
+                "version": getattr(self, "version", "0.0.0"),
+                "author": getattr(self, "author", ""),
+            }
+            self._metadata = metadata
+        return metadata
+    
     def get_settings(self) -> Dict[str, Any]:
         """Get extension settings."""
         return {}
@@ -1,5 +1,4 @@
 from typing import Callable, List, Dict, Any, Optional, Type
-import functools
 import inspect
 
 from .hooks import hook_manager
@@ -24,47 +23,26 @@ def chat_response_hook(func: Callable) -> Callable:
     hook_manager.register_hook('on_chat_response', func)
     return func
 
-def ui_component(location: str, order: int = 0):
-    """Decorator for UI components."""
+def _register_marked(hook_name: str, **markers: Any) -> Callable[[Callable], Callable]:
+    """Build a decorator that tags a function with markers and registers it for a hook.
+    
+    The markers are set on the function itself, so no wrapper is added to its call path.
+    """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._ui_component = True
-        wrapper._ui_location = location
-        wrapper._ui_order = order
-        hook_manager.register_hook('on_ui_tab', wrapper)
-        
-        return wrapper
+        for attr, value in markers.items():
+            setattr(func, attr, value)
+        hook_manager.register_hook(hook_name, func)
+        return func
     return decorator
 
+def ui_component(location: str, order: int = 0):
+    """Decorator for UI components."""
+    return _register_marked('on_ui_tab', _ui_component=True, _ui_location=location, _ui_order=order)
+
 def api_route(path: str, methods: List[str] = ["GET"]):
     """Decorator for API endpoints."""
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._api_route = True
-        wrapper._api_path = path
-        wrapper._api_methods = methods
-        hook_manager.register_hook('on_api_route', wrapper)
-        
-        return wrapper
-    return decorator
+    return _register_marked('on_api_route', _api_route=True, _api_path=path, _api_methods=methods)
 
 def tool(name: str, description: str):
     """Decorator for tools."""
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._tool = True
-        wrapper._tool_name = name
-        wrapper._tool_description = description
-        hook_manager.register_hook('on_tool', wrapper)
-        
-        return wrapper
-    return decorator
+    return _register_marked('on_tool', _tool=True, _tool_name=name, _tool_description=description)
@@ -23,37 +23,68 @@ class HookManager:
                 'on_api_route': [],
                 'on_tool': [],
             }
+            # (is_async, callback) pairs per hook, classified once at registration
+            cls._instance._dispatch = {name: [] for name in cls._instance.hooks}
         return cls._instance
     
     def register_hook(self, hook_name: str, callback: Callable) -> None:
         """Register a callback for a specific hook."""
         if hook_name not in self.hooks:
             self.hooks[hook_name] = []
+            self._dispatch[hook_name] = []
         if callback not in self.hooks[hook_name]:
             self.hooks[hook_name].append(callback)
+            self._dispatch[hook_name].append((asyncio.iscoroutinefunction(callback), callback))
     
     def unregister_hook(self, hook_name: str, callback: Callable) -> None:
         """Unregister a callback for a specific hook."""
         if hook_name in self.hooks and callback in self.hooks[hook_name]:
             self.hooks[hook_name].remove(callback)
+            self._dispatch[hook_name] = [entry for entry in self._dispatch[hook_name] if entry[1] != callback]
     
     async def trigger_hook(self, hook_name: str, *args, **kwargs) -> List[Any]:
         """Trigger all callbacks for a specific hook."""
         results = []
+        append = results.append
         
-        if hook_name not in self.hooks:
-            return results
-        
-        for callback in self.hooks[hook_name]:
+        for is_async, callback in self._dispatch.get(hook_name, ()):
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_async:
                     result = await callback(*args, **kwargs)
                 else:
                     result = callback(*args, **kwargs)
-                results.append(result)
+                append(result)
+            except Exception as e:
+                logger.error(f"Error triggering hook {hook_name}: {str(e)}")
+        
+        return results
+    
+    async def trigger_hook_parallel(self, hook_name: str, *args, **kwargs) -> List[Any]:
+        """Trigger all callbacks for a specific hook, running async callbacks concurrently.
+        
+        Sync callbacks run inline first, then all async callbacks are awaited together.
+        Only use this for hooks whose callbacks do not depend on each other's order;
+        trigger_hook keeps strict registration order.
+        """
+        results = []
+        coroutines = []
+        
+        for is_async, callback in self._dispatch.get(hook_name, ()):
+            try:
+                if is_async:
+                    coroutines.append(callback(*args, **kwargs))
+                else:
+                    results.append(callback(*args, **kwargs))
             except Exception as e:
                 logger.error(f"Error triggering hook {hook_name}: {str(e)}")
         
+        if coroutines:
+            for result in await asyncio.gather(*coroutines, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Error triggering hook {hook_name}: {str(result)}")
+                else:
+                    results.append(result)
+        
         return results
     
     def clear_hooks(self, hook_name: str = None) -> None:
@@ -61,9 +92,11 @@ class HookManager:
         if hook_name:
             if hook_name in self.hooks:
                 self.hooks[hook_name] = []
+                self._dispatch[hook_name] = []
         else:
             for hook_name in self.hooks:
                 self.hooks[hook_name] = []
+                self._dispatch[hook_name] = []
 
 # Singleton instance
 hook_manager = HookManager()
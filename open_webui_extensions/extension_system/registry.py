@@ -1,7 +1,7 @@
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, List, Mapping, Optional, Any, Type
 import importlib
 import importlib.util
-import inspect
+import hashlib
 import os
 import sys
 import json
@@ -9,11 +9,31 @@ import shutil
 import logging
 import pkg_resources
 from pathlib import Path
+from types import MappingProxyType
 
 from .base import Extension
 
 logger = logging.getLogger("open_webui_extensions")
 
+def _find_extension_class(module) -> Optional[Type[Extension]]:
+    """Find the Extension subclass provided by an extension module.
+    
+    The base classes from extension_system.base are skipped even when the
+    module imports them. The result is cached on the module as
+    ``__extension_class__``.
+    """
+    namespace = vars(module)
+    extension_class = namespace.get("__extension_class__")
+    if extension_class is not None:
+        return extension_class
+    
+    for obj in namespace.values():
+        if isinstance(obj, type) and issubclass(obj, Extension) and obj.__module__ != Extension.__module__:
+            module.__extension_class__ = obj
+            return obj
+    
+    return None
+
 class ExtensionRegistry:
     """Registry for discovering and loading extensions."""
     
@@ -25,6 +45,7 @@ class ExtensionRegistry:
         if cls._instance is None:
             cls._instance = super(ExtensionRegistry, cls).__new__(cls)
             cls._instance.extensions = {}
+            cls._instance._config_cache = None
             
             # Set up extension directories
             home_dir = os.path.expanduser("~")
@@ -36,6 +57,9 @@ class ExtensionRegistry:
             # Ensure extension directories exist
             for ext_dir in cls._instance.extension_dirs:
                 os.makedirs(ext_dir, exist_ok=True)
+            
+            # Extension state is kept in the primary extension directory
+            cls._instance.config_file = os.path.join(cls._instance.extension_dirs[0], "extension_config.json")
         
         return cls._instance
     
@@ -45,21 +69,17 @@ class ExtensionRegistry:
         
         # Check each extension directory
         for ext_dir in self.extension_dirs:
-            if not os.path.exists(ext_dir):
+            try:
+                entries = os.scandir(ext_dir)
+            except OSError:
                 continue
             
-            # Look for extension packages
-            for item in os.listdir(ext_dir):
-                item_path = os.path.join(ext_dir, item)
-                
-                # Skip non-directories
-                if not os.path.isdir(item_path):
-                    continue
-                
-                # Check if it's a Python package
-                init_file = os.path.join(item_path, "__init__.py")
-                if os.path.exists(init_file):
-                    extension_ids.append(item)
+            # Look for extension packages; is_dir() uses the cached d_type, so only
+            # directories cost an extra stat for the __init__.py check
+            with entries:
+                for entry in entries:
+                    if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                        extension_ids.append(entry.name)
         
         # Also discover installed extensions via entry points
         for entry_point in pkg_resources.iter_entry_points('open_webui_extensions'):
@@ -92,20 +112,12 @@ class ExtensionRegistry:
             if not os.path.exists(ext_path):
                 continue
             
-            # Add to Python path
-            if ext_path not in sys.path:
-                sys.path.insert(0, ext_dir)
-            
             try:
-                # Import the module
-                module = importlib.import_module(extension_id)
+                # Import the package straight from its directory, leaving sys.path untouched
+                module = self._import_extension_package(extension_id, ext_path)
                 
                 # Find extension class
-                extension_class = None
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isclass(obj) and issubclass(obj, Extension) and obj is not Extension:
-                        extension_class = obj
-                        break
+                extension_class = _find_extension_class(module)
                 
                 if extension_class:
                     extension = extension_class()
@@ -122,6 +134,41 @@ class ExtensionRegistry:
         
         return None
     
+    @staticmethod
+    def _import_extension_package(extension_id: str, ext_path: str):
+        """Import an extension package from its directory.
+        
+        The package is imported under its id, as it was when the extension
+        directory was put on sys.path, so extensions can keep importing their
+        own modules absolutely (``from my_ext import helpers``). If another
+        module already has that name, a name unique to the directory is used
+        instead.
+        """
+        init_path = os.path.join(ext_path, "__init__.py")
+        module_name = extension_id
+        existing = sys.modules.get(module_name)
+        if existing is not None and os.path.realpath(getattr(existing, "__file__", None) or "") != os.path.realpath(init_path):
+            digest = hashlib.blake2b(ext_path.encode(), digest_size=6).hexdigest()
+            module_name = f"ext_{extension_id}_{digest}"
+            logger.warning(f"Module name {extension_id} is taken, importing extension from {ext_path} as {module_name}")
+        
+        spec = importlib.util.spec_from_file_location(
+            module_name,
+            init_path,
+            submodule_search_locations=[ext_path],
+        )
+        if spec is None:
+            raise ImportError(f"No extension package found in {ext_path}")
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return module
+    
     def get_extension(self, extension_id: str) -> Optional[Extension]:
         """Get an extension by ID."""
         if extension_id in self.extensions:
@@ -129,6 +176,10 @@ class ExtensionRegistry:
         
         return self.load_extension(extension_id)
     
+    def get_loaded_extensions(self) -> Dict[str, Extension]:
+        """Get the extensions that have already been imported, without discovering new ones."""
+        return self.extensions
+    
     def get_all_extensions(self) -> Dict[str, Extension]:
         """Get all loaded extensions."""
         # Discover and load any new extensions
@@ -211,22 +262,39 @@ class ExtensionRegistry:
         
         return True
     
+    def _read_config(self) -> Mapping[str, Any]:
+        """Read the extension configuration file.
+        
+        The parsed result is reused for as long as the file's mtime and size
+        are unchanged, so repeated reads cost a single stat() call. It is
+        returned as a read-only mapping so callers cannot corrupt the cache.
+        """
+        try:
+            stat_result = os.stat(self.config_file)
+        except OSError:
+            return {}
+        
+        cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        if self._config_cache is not None and self._config_cache[0] == cache_key:
+            return self._config_cache[1]
+        
+        with open(self.config_file, "r") as f:
+            config = MappingProxyType(json.load(f))
+        
+        self._config_cache = (cache_key, config)
+        return config
+    
     def _save_extension_state(self, extension_id: str, enabled: bool) -> None:
         """Save extension state to a configuration file."""
-        config_file = os.path.join(self.extension_dirs[0], "extension_config.json")
-        
-        # Load existing config
+        # Load existing config (copied so the cached result is never mutated)
         config = {}
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, "r") as f:
-                    config = json.load(f)
-            except:
-                pass
+        try:
+            config = dict(self._read_config())
+        except:
+            pass
         
         # Update config
-        if "enabled" not in config:
-            config["enabled"] = []
+        config["enabled"] = list(config.get("enabled", []))
         
         if enabled:
             if extension_id not in config["enabled"]:
@@ -236,45 +304,47 @@ class ExtensionRegistry:
                 config["enabled"].remove(extension_id)
         
         # Save config
-        with open(config_file, "w") as f:
+        with open(self.config_file, "w") as f:
             json.dump(config, f, indent=2)
     
     def _load_extension_states(self) -> Dict[str, bool]:
         """Load extension states from configuration file."""
-        config_file = os.path.join(self.extension_dirs[0], "extension_config.json")
-        
         # Default states
         states = {}
         
         # Load config if it exists
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, "r") as f:
-                    config = json.load(f)
-                    
-                    # Set states based on enabled list
-                    enabled_extensions = config.get("enabled", [])
-                    for extension_id in self.discover_extensions():
-                        states[extension_id] = extension_id in enabled_extensions
-            except:
-                pass
+        try:
+            config = self._read_config()
+            if config:
+                # Set states based on enabled list
+                enabled_extensions = set(config.get("enabled", []))
+                for extension_id in self.discover_extensions():
+                    states[extension_id] = extension_id in enabled_extensions
+        except:
+            pass
         
         return states
     
     def load_all_extensions(self) -> None:
-        """Load all discovered extensions and their states."""
+        """Load all enabled extensions and their states.
+        
+        Disabled extensions are not imported here; they are loaded on first use
+        through get_extension() or get_all_extensions().
+        """
         # Discover available extensions
         extension_ids = self.discover_extensions()
         
         # Load extension states
         states = self._load_extension_states()
         
-        # Load each extension
+        # Load each enabled extension
         for extension_id in extension_ids:
+            if not states.get(extension_id, False):
+                continue
+            
             extension = self.load_extension(extension_id)
             if extension:
-                # Set enabled state
-                extension.enabled = states.get(extension_id, False)
+                extension.enabled = True
 
 # Singleton instance
 extension_registry = ExtensionRegistry()
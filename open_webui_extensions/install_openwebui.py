@@ -901,17 +901,15 @@ async def install_extension(file: UploadFile = File(...)):
     try:
         # Install the extension
         from extensions import install_extension
-        result = await install_extension(temp_path)
-        
-        # Clean up
-        os.unlink(temp_path)
-        
-        return result
+        return await install_extension(temp_path)
     except Exception as e:
-        # Clean up on error
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
         return {"status": "error", "message": str(e)}
+    finally:
+        # Clean up
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
 
 @app.delete("/extensions/api/{extension_id}/uninstall")
 async def uninstall_extension(extension_id: str):
@@ -1,16 +1,71 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, List, Dict, Any, Optional
 import os
 import tempfile
-import shutil
 import zipfile
 import logging
 
+from extension_framework import ArchiveTooLargeError, extract_archive
+
 from ..extension_system.registry import extension_registry
 
 logger = logging.getLogger("open_webui_extensions")
 
+def _extension_summary(extension_id: str, extension) -> Dict[str, Any]:
+    """Build the API representation of an extension from its cached metadata."""
+    summary = dict(extension.get_metadata())
+    summary["id"] = extension_id
+    summary["enabled"] = extension.enabled
+    summary["installed"] = extension.installed
+    return summary
+
+def _install_uploaded_archive(upload: BinaryIO, extension_id: Optional[str]) -> str:
+    """Extract and install an uploaded extension archive.
+    
+    The archive is read straight from the upload's spooled temporary file
+    rather than being copied to disk first.
+    
+    Returns:
+        The id of the installed extension.
+    """
+    # Create a temporary directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Extract the ZIP file
+        extract_dir = os.path.join(temp_dir, "extracted")
+        os.makedirs(extract_dir, exist_ok=True)
+        
+        try:
+            upload.seek(0)
+            with zipfile.ZipFile(upload, "r") as zip_ref:
+                extract_archive(zip_ref, extract_dir)
+        except zipfile.BadZipFile:
+            raise HTTPException(status_code=400, detail="Invalid ZIP file")
+        except ArchiveTooLargeError:
+            raise HTTPException(status_code=413, detail="Extension archive is too large")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid ZIP file: {e}")
+        
+        # Find the extension directory
+        # The extension should be in a subdirectory with an __init__.py file
+        extension_dir = None
+        for root, dirs, files in os.walk(extract_dir):
+            if "__init__.py" in files:
+                extension_dir = root
+                break
+        
+        if not extension_dir:
+            raise HTTPException(status_code=400, detail="No valid extension found in ZIP file")
+        
+        # Install the extension
+        result = extension_registry.install_extension(extension_dir, extension_id)
+        
+        if not result:
+            raise HTTPException(status_code=500, detail="Failed to install extension")
+        
+        return result
+
 def create_extension_router():
     """Create and return the extension API router."""
     router = APIRouter()
@@ -20,19 +75,10 @@ def create_extension_router():
         """List all installed extensions."""
         extensions = extension_registry.get_all_extensions()
         
-        result = []
-        for extension_id, extension in extensions.items():
-            result.append({
-                "id": extension_id,
-                "name": getattr(extension, "name", extension_id),
-                "description": getattr(extension, "description", ""),
-                "version": getattr(extension, "version", "0.0.0"),
-                "author": getattr(extension, "author", ""),
-                "enabled": extension.enabled,
-                "installed": extension.installed,
-            })
-        
-        return result
+        return [
+            _extension_summary(extension_id, extension)
+            for extension_id, extension in extensions.items()
+        ]
     
     @router.get("/{extension_id}")
     async def get_extension(extension_id: str):
@@ -42,15 +88,7 @@ def create_extension_router():
         if not extension:
             raise HTTPException(status_code=404, detail=f"Extension {extension_id} not found")
         
-        return {
-            "id": extension_id,
-            "name": getattr(extension, "name", extension_id),
-            "description": getattr(extension, "description", ""),
-            "version": getattr(extension, "version", "0.0.0"),
-            "author": getattr(extension, "author", ""),
-            "enabled": extension.enabled,
-            "installed": extension.installed,
-        }
+        return _extension_summary(extension_id, extension)
     
     @router.post("/{extension_id}/enable")
     async def enable_extension(extension_id: str):
@@ -67,7 +105,7 @@ def create_extension_router():
         try:
             await extension.on_startup()
         except Exception as e:
-            logger.error(f"Error starting extension {extension_id}: {str(e)}")
+            logger.error("Error starting extension %s: %s", extension_id, e)
             return JSONResponse(status_code=500, content={"detail": str(e)})
         
         return {"status": "success"}
@@ -85,7 +123,7 @@ def create_extension_router():
         try:
             await extension.on_shutdown()
         except Exception as e:
-            logger.error(f"Error shutting down extension {extension_id}: {str(e)}")
+            logger.error("Error shutting down extension %s: %s", extension_id, e)
         
         # Disable the extension
         success = extension_registry.disable_extension(extension_id)
@@ -102,41 +140,9 @@ def create_extension_router():
         extension_id: Optional[str] = Form(None)
     ):
         """Install an extension from a ZIP file."""
-        # Create a temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Save uploaded file
-            zip_path = os.path.join(temp_dir, file.filename)
-            with open(zip_path, "wb") as f:
-                shutil.copyfileobj(file.file, f)
-            
-            # Extract the ZIP file
-            extract_dir = os.path.join(temp_dir, "extracted")
-            os.makedirs(extract_dir, exist_ok=True)
-            
-            try:
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(extract_dir)
-            except zipfile.BadZipFile:
-                raise HTTPException(status_code=400, detail="Invalid ZIP file")
-            
-            # Find the extension directory
-            # The extension should be in a subdirectory with an __init__.py file
-            extension_dir = None
-            for root, dirs, files in os.walk(extract_dir):
-                if "__init__.py" in files:
-                    extension_dir = root
-                    break
-            
-            if not extension_dir:
-                raise HTTPException(status_code=400, detail="No valid extension found in ZIP file")
-            
-            # Install the extension
-            result = extension_registry.install_extension(extension_dir, extension_id)
-            
-            if not result:
-                raise HTTPException(status_code=500, detail="Failed to install extension")
-            
-            return {"status": "success", "extension_id": result}
+        # Extracting and installing are blocking file I/O
+        result = await run_in_threadpool(_install_uploaded_archive, file.file, extension_id)
+        return {"status": "success", "extension_id": result}
     
     @router.delete("/{extension_id}")
     async def uninstall_extension(extension_id: str):
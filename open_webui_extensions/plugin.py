@@ -2,6 +2,7 @@ from typing import Callable, Dict, List, Any
 import logging
 import inspect
 import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
 
 from .extension_system.base import Extension
@@ -11,33 +12,63 @@ from .manager.api import create_extension_router
 
 logger = logging.getLogger("open_webui_extensions")
 
+# Static files of the extension manager UI
+_STATIC_PATH = str(Path(__file__).parent / "manager" / "static")
+
+@asynccontextmanager
+async def _logged_lifespan(extension_id: str, extension: Extension, app):
+    """Enter an extension's lifespan, logging its errors instead of propagating them."""
+    context = extension.lifespan(app)
+    try:
+        await context.__aenter__()
+    except Exception as e:
+        logger.error(f"Error starting extension {extension_id}: {str(e)}")
+        yield
+        return
+    
+    try:
+        yield
+    finally:
+        try:
+            await context.__aexit__(None, None, None)
+        except Exception as e:
+            logger.error(f"Error shutting down extension {extension_id}: {str(e)}")
+
+@asynccontextmanager
+async def extensions_lifespan(app):
+    """Merged lifespan of all enabled extensions.
+    
+    Extensions are started in load order and shut down in reverse order.
+    Suitable for ``FastAPI(lifespan=extensions_lifespan)``.
+    """
+    # Load all extensions
+    extension_registry.load_all_extensions()
+    
+    async with AsyncExitStack() as stack:
+        for extension_id, extension in list(extension_registry.get_loaded_extensions().items()):
+            if extension.enabled:
+                await stack.enter_async_context(_logged_lifespan(extension_id, extension, app))
+        
+        logger.info("Extension system initialized")
+        yield
+    
+    logger.info("Extension system shut down")
+
 class OpenWebUIPlugin:
     """Plugin for integrating with Open WebUI."""
     
     def __init__(self):
         self.initialized = False
+        self._lifespan_context = None
     
-    async def on_startup(self, app):
-        """Initialize the extension system when Open WebUI starts."""
-        if self.initialized:
-            return
-        
-        try:
-            # Load all extensions
-            extension_registry.load_all_extensions()
-            
+    @asynccontextmanager
+    async def lifespan(self, app):
+        """Run the extension system, including its routes, for the lifetime of the app."""
+        async with extensions_lifespan(app):
             # Register API routes
             api_router = create_extension_router()
             app.include_router(api_router, prefix="/api/extensions")
             
-            # Call startup hooks for enabled extensions
-            for extension_id, extension in extension_registry.get_all_extensions().items():
-                if extension.enabled:
-                    try:
-                        await extension.on_startup()
-                    except Exception as e:
-                        logger.error(f"Error starting extension {extension_id}: {str(e)}")
-            
             # Add UI routes
             self._add_ui_routes(app)
             
@@ -45,24 +76,31 @@ class OpenWebUIPlugin:
             self._add_extension_api_routes(app)
             
             self.initialized = True
-            logger.info("Extension system initialized")
+            try:
+                yield
+            finally:
+                self.initialized = False
+    
+    async def on_startup(self, app):
+        """Initialize the extension system when Open WebUI starts."""
+        if self.initialized:
+            return
         
+        try:
+            context = self.lifespan(app)
+            await context.__aenter__()
+            self._lifespan_context = context
         except Exception as e:
             logger.error(f"Error initializing extension system: {str(e)}")
     
     async def on_shutdown(self, app):
         """Clean up the extension system when Open WebUI shuts down."""
-        try:
-            # Call shutdown hooks for enabled extensions
-            for extension_id, extension in extension_registry.get_all_extensions().items():
-                if extension.enabled:
-                    try:
-                        await extension.on_shutdown()
-                    except Exception as e:
-                        logger.error(f"Error shutting down extension {extension_id}: {str(e)}")
-            
-            logger.info("Extension system shut down")
+        context, self._lifespan_context = self._lifespan_context, None
+        if context is None:
+            return
         
+        try:
+            await context.__aexit__(None, None, None)
         except Exception as e:
             logger.error(f"Error shutting down extension system: {str(e)}")
     
@@ -76,21 +114,22 @@ class OpenWebUIPlugin:
         app.include_router(ui_router, prefix="/api/_extensions/ui")
         
         # Add static files for extension manager
-        static_path = Path(__file__).parent / "manager" / "static"
-        app.mount("/api/_extensions/static", StaticFiles(directory=str(static_path)), name="extension_static")
+        app.mount("/api/_extensions/static", StaticFiles(directory=_STATIC_PATH), name="extension_static")
     
     def _add_extension_api_routes(self, app):
         """Add API routes defined by extensions."""
-        for extension_id, extension in extension_registry.get_all_extensions().items():
+        from fastapi import APIRouter
+        
+        # Collect every extension route into one router first
+        extension_router = APIRouter()
+        for extension_id, extension in extension_registry.get_loaded_extensions().items():
             if extension.enabled and hasattr(extension, "api_routes"):
                 for route in extension.api_routes:
                     path = f"/api/extensions/{extension_id}{route['path']}"
-                    endpoint = route['endpoint']
-                    methods = route['methods']
-                    
-                    # Register the route
-                    for method in methods:
-                        app.add_api_route(path, endpoint, methods=[method])
+                    extension_router.add_api_route(path, route['endpoint'], methods=route['methods'])
+        
+        # Attach the compiled routes in one step; include_router would rebuild each route again
+        app.router.routes.extend(extension_router.routes)
 
 # Create singleton instance
 plugin = OpenWebUIPlugin()
@@ -98,3 +137,4 @@ plugin = OpenWebUIPlugin()
 # Export the functions for Open WebUI to call
 on_startup = plugin.on_startup
 on_shutdown = plugin.on_shutdown
+lifespan = plugin.lifespan
@@ -0,0 +1,77 @@
+"""
+Shared fixtures for the extension manager tests.
+"""
+
+import os
+import tempfile
+from typing import Callable, Sequence
+
+import pytest
+
+# The registry module creates its singleton on import, so point it at a
+# scratch directory before any test imports it
+os.environ["EXTENSIONS_DIR"] = tempfile.mkdtemp(prefix="extensions-")
+
+# Every activation appends a line to an "activations" file next to the module
+_EXTENSION_TEMPLATE = '''
+import os
+
+from extension_framework import Extension
+
+class TestExtension(Extension):
+    name = {name!r}
+    version = "1.0.0"
+    description = "Test extension {name}"
+    author = "Tests"
+    
+    @property
+    def dependencies(self):
+        return {dependencies!r}
+    
+    def activate(self):
+        with open(os.path.join(os.path.dirname(__file__), "activations"), "a") as f:
+            f.write("activated\\n")
+        return True
+'''
+
+def count_activations(package_dir: str) -> int:
+    """Count how often the extension written to package_dir was activated."""
+    try:
+        with open(os.path.join(package_dir, "activations"), "r", encoding="utf-8") as f:
+            return len(f.readlines())
+    except FileNotFoundError:
+        return 0
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """A fresh extension registry over an empty extensions directory.
+    
+    It replaces the module-level registry singleton that the API uses.
+    """
+    from extension_manager.backend import api
+    from extension_manager.backend import registry as registry_module
+    
+    monkeypatch.setattr(registry_module.ExtensionRegistry, "_instance", None)
+    fresh = registry_module.ExtensionRegistry(str(tmp_path / "extensions"))
+    monkeypatch.setattr(registry_module, "registry", fresh)
+    monkeypatch.setattr(api, "registry", fresh)
+    
+    monkeypatch.setattr(api, "_response_cache", {})
+    monkeypatch.setattr(api, "_response_cache_version", -1)
+    return fresh
+
+@pytest.fixture
+def make_extension(registry) -> Callable[..., str]:
+    """Write an extension package into the registry's extensions directory.
+    
+    Returns a function taking the extension name and the names of its
+    dependencies, which returns the package directory.
+    """
+    def make(name: str, dependencies: Sequence[str] = ()) -> str:
+        package_dir = os.path.join(registry.extensions_dir, name)
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, "__init__.py"), "w", encoding="utf-8") as f:
+            f.write(_EXTENSION_TEMPLATE.format(name=name, dependencies=list(dependencies)))
+        return package_dir
+    
+    return make
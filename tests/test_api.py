@@ -0,0 +1,136 @@
+"""
+Tests for the extension manager API.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from extension_manager.backend import api
+
+@pytest.fixture
+def client(registry):
+    app = FastAPI()
+    app.include_router(api.get_router())
+    return TestClient(app)
+
+@pytest.fixture
+def extension_names(registry, make_extension):
+    names = [f"ext{i:02d}" for i in range(7)]
+    for name in names:
+        make_extension(name)
+    registry.discover()
+    return names
+
+def _list(client, **params):
+    response = client.get("/api/extensions/", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+def test_cursor_round_trip(client, extension_names):
+    listed = []
+    body = _list(client, page_size=3)
+    while True:
+        listed.extend(ext["name"] for ext in body["extensions"])
+        if not body["next_cursor"]:
+            break
+        body = _list(client, page_size=3, cursor=body["next_cursor"])
+    
+    assert listed == extension_names
+    assert not body["has_more"]
+
+def test_cursor_pages_match_offset_pages(client, extension_names):
+    first = _list(client, page_size=3)
+    second = _list(client, page_size=3, cursor=first["next_cursor"])
+    assert second["extensions"] == _list(client, page_size=3, page=2)["extensions"]
+
+def test_cursor_survives_removed_extension(client, registry, extension_names):
+    first = _list(client, page_size=3)
+    registry.uninstall_extension(extension_names[2])
+    
+    second = _list(client, page_size=3, cursor=first["next_cursor"])
+    assert [ext["name"] for ext in second["extensions"]] == extension_names[3:6]
+
+def test_cursor_counts_total_after_cursor(client, extension_names):
+    first = _list(client, page_size=3, include_total=True)
+    assert first["total"] == len(extension_names)
+    
+    second = _list(client, page_size=3, include_total=True, cursor=first["next_cursor"])
+    assert second["total"] == len(extension_names) - 3
+
+def test_cursor_with_non_ascii_name(registry, make_extension):
+    make_extension("ext_ä")
+    registry.discover()
+    
+    cursor = api._encode_cursor("ext_ä")
+    assert "=" not in cursor
+    assert api._decode_cursor(cursor) == "ext_ä"
+
+def test_invalid_cursor_is_rejected(client, extension_names):
+    # Decodes to a byte that is not valid UTF-8
+    response = client.get("/api/extensions/", params={"cursor": "_w"})
+    assert response.status_code == 400
+
+def test_list_cache_is_invalidated_by_mutations(client, registry, extension_names):
+    name = extension_names[0]
+    assert _list(client, page_size=1)["extensions"][0]["status"] == "inactive"
+    
+    registry.enable_extension(name)
+    assert _list(client, page_size=1)["extensions"][0]["status"] == "active"
+    
+    registry.disable_extension(name)
+    assert _list(client, page_size=1)["extensions"][0]["status"] == "inactive"
+    
+    registry.uninstall_extension(name)
+    assert _list(client, page_size=1)["extensions"][0]["name"] == extension_names[1]
+
+def test_detail_cache_is_invalidated_by_mutations(client, registry, extension_names):
+    name = extension_names[0]
+    assert client.get(f"/api/extensions/{name}").json()["extension"]["status"] == "inactive"
+    
+    registry.enable_extension(name)
+    assert client.get(f"/api/extensions/{name}").json()["extension"]["status"] == "active"
+
+def test_etag_changes_with_the_registry(client, registry, extension_names):
+    response = client.get("/api/extensions/")
+    etag = response.headers["ETag"]
+    
+    cached = client.get("/api/extensions/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    
+    registry.enable_extension(extension_names[0])
+    fresh = client.get("/api/extensions/", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+
+def test_stale_build_does_not_replace_newer_response(registry, extension_names):
+    started = threading.Event()
+    release = threading.Event()
+    
+    def build_before_change():
+        started.set()
+        release.wait(5)
+        return "before"
+    
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        stale = asyncio.ensure_future(api._cached_response("key", build_before_change))
+        await loop.run_in_executor(None, started.wait, 5)
+        
+        # The registry changes while the first response is still being built
+        await loop.run_in_executor(None, registry.enable_extension, extension_names[0])
+        assert await api._cached_response("key", lambda: "after") == "after"
+        
+        release.set()
+        assert await stale == "before"
+        return await api._cached_response("key", lambda: "rebuilt")
+    
+    assert asyncio.run(scenario()) == "after"
+
+@pytest.mark.parametrize("params", [{"page": 0}, {"page": -1}, {"page_size": 0}])
+def test_invalid_page_is_rejected(client, extension_names, params):
+    response = client.get("/api/extensions/", params=params)
+    assert response.status_code == 422
@@ -0,0 +1,31 @@
+"""
+Tests for the extension base class.
+"""
+
+import pytest
+
+from extension_framework import Extension
+
+class CompleteExtension(Extension):
+    name = "complete"
+    version = "1.0.0"
+    description = "Has all the required metadata"
+    author = "Tests"
+
+def test_extension_without_metadata_cannot_be_instantiated():
+    class Incomplete(Extension):
+        name = "incomplete"
+        version = "1.0.0"
+    
+    with pytest.raises(TypeError, match="without metadata: description, author"):
+        Incomplete()
+
+def test_extension_with_metadata_can_be_instantiated():
+    assert CompleteExtension().name == "complete"
+
+def test_subclasses_inherit_metadata():
+    class Derived(CompleteExtension):
+        version = "2.0.0"
+    
+    assert Derived._missing_metadata == ()
+    assert Derived().version == "2.0.0"
@@ -0,0 +1,62 @@
+"""
+Tests for the open_webui_extensions extension system.
+"""
+
+import os
+import sys
+
+import pytest
+
+from open_webui_extensions.extension_system.registry import ExtensionRegistry
+
+_PACKAGE = '''
+from open_webui_extensions.extension_system.base import Extension
+from {name} import helpers
+
+class HelperExtension(Extension):
+    name = "Helper"
+    description = "Imports its own module by package name"
+    version = "1.0.0"
+    author = "Tests"
+    greeting = helpers.GREETING
+'''
+
+@pytest.fixture
+def extension_registry(tmp_path, monkeypatch):
+    registry = ExtensionRegistry()
+    monkeypatch.setattr(registry, "extension_dirs", [str(tmp_path)])
+    monkeypatch.setattr(registry, "extensions", {})
+    return registry
+
+def _write_package(directory, name):
+    package_dir = directory / name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(_PACKAGE.format(name=name), encoding="utf-8")
+    (package_dir / "helpers.py").write_text('GREETING = "hello"\n', encoding="utf-8")
+
+def test_extension_can_import_its_own_modules_by_name(extension_registry, tmp_path, monkeypatch):
+    monkeypatch.delitem(sys.modules, "helper_ext", raising=False)
+    monkeypatch.delitem(sys.modules, "helper_ext.helpers", raising=False)
+    _write_package(tmp_path, "helper_ext")
+    
+    extension = extension_registry.load_extension("helper_ext")
+    
+    assert extension is not None
+    assert extension.greeting == "hello"
+    assert sys.modules["helper_ext"].__file__ == os.path.join(str(tmp_path), "helper_ext", "__init__.py")
+    assert str(tmp_path) not in sys.path
+
+def test_extension_named_like_a_loaded_module_gets_a_unique_name(extension_registry, tmp_path):
+    (tmp_path / "json").mkdir()
+    (tmp_path / "json" / "__init__.py").write_text(
+        "from open_webui_extensions.extension_system.base import Extension\n"
+        "class JsonExtension(Extension):\n"
+        "    name = 'JSON'\n",
+        encoding="utf-8",
+    )
+    
+    extension = extension_registry.load_extension("json")
+    
+    assert extension is not None
+    assert type(extension).__module__.startswith("ext_json_")
+    assert hasattr(sys.modules["json"], "dumps")
@@ -0,0 +1,87 @@
+"""
+Tests for the extension framework utilities.
+"""
+
+import asyncio
+import os
+import sys
+import zipfile
+
+import pytest
+
+from extension_framework import utils
+
+def test_async_download_without_aiohttp_raises_a_clear_error(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "aiohttp", None)
+    
+    with pytest.raises(ImportError, match=r"open-webui-extensions\[async\]"):
+        asyncio.run(utils.download_file_async("https://example.com/ext.zip", str(tmp_path / "ext.zip")))
+    
+    with pytest.raises(ImportError, match=r"open-webui-extensions\[async\]"):
+        asyncio.run(utils.install_extension_from_url_async("https://example.com/ext.zip", str(tmp_path)))
+
+_EXTENSION = '''
+from extension_framework import Extension
+
+class ZippedExtension(Extension):
+    name = "zipped"
+    version = "1.0.0"
+    description = "Installed from a ZIP file"
+    author = "Tests"
+'''
+
+def _cached_modules_under(directory):
+    prefix = os.path.join(os.path.realpath(directory), "")
+    return [path for path in utils._module_cache if path.startswith(prefix)]
+
+def test_modules_are_forgotten_after_install_and_uninstall(tmp_path):
+    archive = tmp_path / "zipped.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("zipped/__init__.py", _EXTENSION)
+    extensions_dir = tmp_path / "extensions"
+    
+    target_dir = utils.install_extension_from_zip(str(archive), str(extensions_dir))
+    assert target_dir == str(extensions_dir / "zipped")
+    assert _cached_modules_under(extensions_dir) == []
+    
+    init_path = os.path.join(target_dir, "__init__.py")
+    assert utils.load_extension(init_path).name == "zipped"
+    module_name = utils._module_name_for(os.path.realpath(init_path))
+    assert module_name in sys.modules
+    
+    assert utils.uninstall_extension("zipped", str(extensions_dir))
+    assert _cached_modules_under(extensions_dir) == []
+    assert module_name not in sys.modules
+
+def _zip(path, entries):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    return zipfile.ZipFile(path)
+
+def test_extract_archive_writes_the_entries(tmp_path):
+    target = tmp_path / "target"
+    with _zip(tmp_path / "ok.zip", {"ext/__init__.py": "x = 1\n", "ext/data/file.txt": "data"}) as zf:
+        utils.extract_archive(zf, str(target))
+    
+    assert (target / "ext" / "__init__.py").read_text() == "x = 1\n"
+    assert (target / "ext" / "data" / "file.txt").read_text() == "data"
+
+def test_extract_archive_rejects_paths_outside_the_target(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    with _zip(tmp_path / "evil.zip", {"ext/__init__.py": "", "../evil.py": "pwned"}) as zf:
+        with pytest.raises(ValueError, match="outside"):
+            utils.extract_archive(zf, str(target))
+    
+    assert not (tmp_path / "evil.py").exists()
+
+def test_extract_archive_rejects_archives_that_expand_too_far(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    with _zip(tmp_path / "bomb.zip", {"ext/__init__.py": "", "ext/big.bin": b"\0" * 4096}) as zf:
+        with pytest.raises(utils.ArchiveTooLargeError):
+            utils.extract_archive(zf, str(target), max_size=1024)
+    
+    # Nothing is written before the size check
+    assert list(target.iterdir()) == []
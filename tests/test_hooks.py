@@ -0,0 +1,40 @@
+"""
+Tests for the extension hook registry.
+"""
+
+from extension_framework.hooks import HookRegistry
+
+def _callback(label):
+    return lambda: label
+
+def test_callbacks_run_by_priority_then_registration_order():
+    hooks = HookRegistry()
+    hooks.register_callback("ui_init", _callback("late"), "a", priority=20)
+    hooks.register_callback("ui_init", _callback("first"), "b", priority=5)
+    hooks.register_callback("ui_init", _callback("second"), "c", priority=10)
+    hooks.register_callback("ui_init", _callback("third"), "d", priority=10)
+    
+    assert hooks.execute_hook("ui_init") == ["first", "second", "third", "late"]
+
+def test_unregister_removes_every_callback_of_the_extension():
+    hooks = HookRegistry()
+    hooks.register_callback("ui_init", _callback("a1"), "a", priority=1)
+    hooks.register_callback("ui_init", _callback("b"), "b", priority=5)
+    hooks.register_callback("ui_init", _callback("a2"), "a", priority=10)
+    
+    assert hooks.unregister_callback("ui_init", "a")
+    assert not hooks.unregister_callback("ui_init", "a")
+    assert hooks.execute_hook("ui_init") == ["b"]
+    
+    # Priorities stay aligned with the callbacks after removal
+    hooks.register_callback("ui_init", _callback("c"), "c", priority=3)
+    hooks.register_callback("ui_init", _callback("d"), "d", priority=7)
+    assert hooks.execute_hook("ui_init") == ["c", "b", "d"]
+    assert [cb["extension"] for cb in hooks.get_callbacks("ui_init")["ui_init"]] == ["c", "b", "d"]
+
+def test_callbacks_for_unknown_hooks_register_the_hook():
+    hooks = HookRegistry()
+    
+    assert hooks.register_callback("custom_hook", _callback("x"), "a")
+    assert "custom_hook" in hooks.get_hooks()
+    assert hooks.execute_hook("custom_hook") == ["x"]
@@ -0,0 +1,28 @@
+"""
+Tests for the MCP connector's server configuration manager.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+# The mcp_connector package sets its own __name__ to the extension's display
+# name, so load the client module straight from its file
+_spec = importlib.util.spec_from_file_location(
+    "mcp_client", os.path.join(os.path.dirname(__file__), os.pardir, "mcp_connector", "mcp_client.py")
+)
+mcp_client = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mcp_client)
+
+def test_loaded_servers_do_not_share_state_with_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(mcp_client, "_CONFIG_DIR", str(tmp_path))
+    manager = mcp_client.MCPServerManager()
+    
+    servers = manager.load_servers()
+    servers[0].url = "http://changed.invalid"
+    
+    assert manager.load_servers()[0].url == "http://localhost:11434/v1"
+    assert manager.get_server("Example MCP Server").url == "http://localhost:11434/v1"
@@ -0,0 +1,89 @@
+"""
+Tests for the MCP connector's HTML script injection and static files.
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import mcp_connector
+from mcp_connector import CachingStaticFiles, MCPScriptMiddleware
+
+def _app(chunks, content_type=b"text/html; charset=utf-8"):
+    """An ASGI app that sends the body in the given chunks."""
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", content_type), (b"content-length", b"0")],
+        })
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+    
+    return app
+
+def _run(chunks, path="/", content_type=b"text/html; charset=utf-8"):
+    """Run a request through the middleware, returning the start message and the body messages."""
+    messages = []
+    
+    async def send(message):
+        messages.append(message)
+    
+    scope = {"type": "http", "path": path}
+    asyncio.run(MCPScriptMiddleware(_app(chunks, content_type))(scope, None, send))
+    return messages[0], messages[1:]
+
+def _body(messages):
+    return b"".join(message["body"] for message in messages)
+
+def test_script_is_injected_before_the_closing_body_tag():
+    start, messages = _run([b"<html><body>hi</body></html>"])
+    
+    assert _body(messages) == b"<html><body>hi" + mcp_connector.SCRIPT_TAG_BYTES + b"</html>"
+    assert all(key != b"content-length" for key, _ in start["headers"])
+
+def test_closing_tag_split_across_chunks_is_found():
+    _, messages = _run([b"<html><body>hi</bo", b"dy></ht", b"ml>"])
+    
+    assert _body(messages) == b"<html><body>hi" + mcp_connector.SCRIPT_TAG_BYTES + b"</html>"
+
+def test_only_the_last_closing_tag_is_replaced():
+    _, messages = _run([b"<p></body></p>", b"<body>x</body>", b""])
+    
+    assert _body(messages) == b"<p></body></p><body>x" + mcp_connector.SCRIPT_TAG_BYTES
+
+def test_body_is_streamed_before_the_last_chunk():
+    _, messages = _run([b"<html><body>" + b"a" * 100, b"</body></html>"])
+    
+    # Everything but a possible partial tag goes out with the first chunk
+    assert messages[0]["more_body"]
+    assert len(messages[0]["body"]) >= 100
+    assert _body(messages).endswith(mcp_connector.SCRIPT_TAG_BYTES + b"</html>")
+
+def test_non_html_and_api_responses_are_untouched():
+    _, messages = _run([b'{"a": "</body>"}'], content_type=b"application/json")
+    assert _body(messages) == b'{"a": "</body>"}'
+    
+    _, messages = _run([b"<body></body>"], path="/api/ext/mcp_connector/servers")
+    assert _body(messages) == b"<body></body>"
+
+def test_static_files_answer_matching_etags_with_not_modified(tmp_path):
+    (tmp_path / "script.js").write_text("console.log(1);")
+    app = FastAPI()
+    app.mount("/static", CachingStaticFiles(directory=str(tmp_path)))
+    client = TestClient(app)
+    
+    response = client.get("/static/script.js")
+    assert response.status_code == 200
+    assert response.text == "console.log(1);"
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == CachingStaticFiles.cache_control
+    
+    response = client.get("/static/script.js", headers={"If-None-Match": f'"other", {etag}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    
+    response = client.get("/static/script.js", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
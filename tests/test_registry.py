@@ -0,0 +1,298 @@
+"""
+Tests for the extension registry.
+"""
+
+import asyncio
+import os
+import stat
+import threading
+
+import yaml
+
+from conftest import count_activations
+
+def _saved_statuses(registry):
+    with open(registry.config_file, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    return {ext["name"]: ext["status"] for ext in config["extensions"]}
+
+def test_batch_defers_saves_until_it_ends(registry, make_extension):
+    make_extension("alpha")
+    registry.discover()
+    
+    with registry._batch():
+        registry.enable_extension("alpha")
+        assert _saved_statuses(registry)["alpha"] == "inactive"
+    
+    assert _saved_statuses(registry)["alpha"] == "active"
+
+def test_batch_does_not_defer_other_threads_saves(registry, make_extension):
+    make_extension("alpha")
+    make_extension("beta")
+    registry.discover()
+    
+    entered = threading.Event()
+    release = threading.Event()
+    
+    def batch():
+        with registry._batch():
+            registry.enable_extension("alpha")
+            entered.set()
+            release.wait(5)
+    
+    thread = threading.Thread(target=batch)
+    thread.start()
+    try:
+        assert entered.wait(5)
+        registry.enable_extension("beta")
+        assert _saved_statuses(registry)["beta"] == "active"
+    finally:
+        release.set()
+        thread.join()
+    
+    assert _saved_statuses(registry) == {"alpha": "active", "beta": "active"}
+
+def test_status_changes_are_saved_without_changing_updated_at(registry, make_extension):
+    make_extension("alpha")
+    make_extension("beta")
+    registry.discover()
+    updated_at = registry.extensions["alpha"].updated_at
+    
+    registry.enable_extension("alpha")
+    assert _saved_statuses(registry) == {"alpha": "active", "beta": "inactive"}
+    registry.disable_extension("alpha")
+    assert _saved_statuses(registry) == {"alpha": "inactive", "beta": "inactive"}
+    
+    assert registry.extensions["alpha"].updated_at == updated_at
+
+def test_enable_activates_dependencies_first(registry, make_extension):
+    make_extension("app", dependencies=["middle", "base"])
+    make_extension("middle", dependencies=["base"])
+    make_extension("base")
+    registry.discover()
+    
+    with registry._lock:
+        assert registry._activation_order(["app"]) == ["base", "middle", "app"]
+    
+    success, _, message = registry.enable_extension("app")
+    assert success, message
+    assert all(registry.extensions[name].status == "active" for name in ("app", "middle", "base"))
+
+def test_activation_order_skips_active_dependencies(registry, make_extension):
+    make_extension("app", dependencies=["base"])
+    make_extension("base")
+    registry.discover()
+    registry.enable_extension("base")
+    
+    with registry._lock:
+        assert registry._activation_order(["app"]) == ["base", "app"]
+        assert registry._dependencies["base"] == frozenset()
+
+def test_enable_reports_dependency_cycle(registry, make_extension):
+    make_extension("app", dependencies=["first"])
+    make_extension("first", dependencies=["second"])
+    make_extension("second", dependencies=["first"])
+    registry.discover()
+    
+    success, _, message = registry.enable_extension("app")
+    assert not success
+    assert message == "Circular dependencies between extensions: first, second"
+    assert all(ext.status == "inactive" for ext in registry.extensions.values())
+
+def test_enable_reports_missing_dependency(registry, make_extension):
+    make_extension("app", dependencies=["base"])
+    make_extension("base", dependencies=["missing"])
+    registry.discover()
+    
+    success, _, message = registry.enable_extension("app")
+    assert not success
+    assert message == "Extension base has unresolved dependencies: missing"
+    assert all(ext.status == "inactive" for ext in registry.extensions.values())
+
+def test_enable_reports_self_dependency(registry, make_extension):
+    make_extension("app", dependencies=["app"])
+    registry.discover()
+    
+    success, _, message = registry.enable_extension("app")
+    assert not success
+    assert message == "Circular dependencies between extensions: app"
+
+def test_config_writes_leave_no_temporary_files(registry, make_extension):
+    make_extension("alpha")
+    registry.discover()
+    registry.enable_extension("alpha")
+    
+    config_dir = os.path.dirname(registry.config_file)
+    assert not [name for name in os.listdir(config_dir) if name.endswith(".tmp")]
+    assert stat.S_IMODE(os.stat(registry.config_file).st_mode) == 0o644
+
+def _block_initialize(registry, name):
+    """Make an extension's initialize() wait, returning the (started, release) events."""
+    started = threading.Event()
+    release = threading.Event()
+    
+    def initialize(context):
+        started.set()
+        release.wait(5)
+        return True
+    
+    registry.instances[name].initialize = initialize
+    return started, release
+
+def test_pending_status_changes_the_version_and_is_not_saved(registry, make_extension):
+    make_extension("alpha")
+    make_extension("beta")
+    registry.discover()
+    started, release = _block_initialize(registry, "alpha")
+    
+    version = registry.version
+    thread = threading.Thread(target=registry.enable_extension, args=("alpha",))
+    thread.start()
+    try:
+        assert started.wait(5)
+        assert registry.extensions["alpha"].status == "pending"
+        assert registry.version != version
+        
+        # An unrelated save while alpha is pending
+        registry.enable_extension("beta")
+        assert _saved_statuses(registry) == {"alpha": "inactive", "beta": "active"}
+        
+        version = registry.version
+    finally:
+        release.set()
+        thread.join()
+    
+    assert registry.version != version
+    assert _saved_statuses(registry) == {"alpha": "active", "beta": "active"}
+
+def test_failed_activation_restores_status_and_changes_the_version(registry, make_extension):
+    make_extension("alpha")
+    registry.discover()
+    registry.instances["alpha"].activate = lambda: False
+    
+    version = registry.version
+    success, ext_info, _ = registry.enable_extension("alpha")
+    assert not success
+    assert ext_info.status == "inactive"
+    assert registry.version != version
+    assert not registry._pending
+
+def test_dependency_cannot_be_disabled_while_dependent_is_enabled(registry, make_extension):
+    make_extension("app", dependencies=["middle", "base"])
+    make_extension("middle")
+    make_extension("base")
+    registry.discover()
+    registry.enable_extension("base")
+    started, release = _block_initialize(registry, "middle")
+    
+    thread = threading.Thread(target=registry.enable_extension, args=("app",))
+    thread.start()
+    try:
+        assert started.wait(5)
+        success, _, message = registry.disable_extension("base")
+        assert not success
+        assert message == "Extension base cannot be disabled because it is required by: app"
+    finally:
+        release.set()
+        thread.join()
+    
+    assert {name: ext.status for name, ext in registry.extensions.items()} == {
+        "app": "active",
+        "middle": "active",
+        "base": "active",
+    }
+
+def test_unreached_extensions_are_restored_after_a_failed_dependency(registry, make_extension):
+    make_extension("app", dependencies=["base"])
+    make_extension("base")
+    registry.discover()
+    registry.instances["base"].activate = lambda: False
+    
+    success, _, message = registry.enable_extension("app")
+    assert not success
+    assert message == "Failed to enable dependency base: Failed to activate extension base"
+    assert {name: ext.status for name, ext in registry.extensions.items()} == {"app": "inactive", "base": "inactive"}
+    assert not registry._pending
+
+def _count_discoveries(registry, monkeypatch):
+    calls = []
+    discover = registry.discover
+    
+    def counting_discover():
+        calls.append(None)
+        return discover()
+    
+    monkeypatch.setattr(registry, "discover", counting_discover)
+    return calls
+
+def test_empty_registry_is_not_rediscovered_while_unchanged(registry, monkeypatch):
+    os.makedirs(os.path.join(registry.extensions_dir, "not_an_extension"))
+    calls = _count_discoveries(registry, monkeypatch)
+    
+    registry.list_extensions()
+    registry.list_extensions()
+    registry.initialize_all()
+    
+    assert len(calls) == 1
+    assert os.path.exists(registry.config_file)
+
+def test_empty_registry_is_rediscovered_after_a_new_extension(registry, make_extension, monkeypatch):
+    calls = _count_discoveries(registry, monkeypatch)
+    registry.list_extensions()
+    
+    make_extension("alpha")
+    extensions, _, _ = registry.list_extensions()
+    
+    assert len(calls) == 2
+    assert [ext.name for ext in extensions] == ["alpha"]
+
+def _restart(registry, monkeypatch):
+    """Create a new registry over the same directory, as a restarted process would."""
+    registry_class = type(registry)
+    monkeypatch.setattr(registry_class, "_instance", None)
+    return registry_class(registry.extensions_dir)
+
+def test_initialize_all_starts_saved_active_extensions(registry, make_extension, monkeypatch):
+    app_dir = make_extension("app", dependencies=["base"])
+    base_dir = make_extension("base")
+    make_extension("idle")
+    registry.discover()
+    registry.enable_extension("app")
+    
+    restarted = _restart(registry, monkeypatch)
+    results = restarted.initialize_all()
+    
+    assert list(results) == ["base", "app"]
+    assert all(success for success, _ in results.values())
+    assert (count_activations(base_dir), count_activations(app_dir)) == (2, 2)
+    
+    # Extensions already started are not started again
+    restarted.initialize_all()
+    assert (count_activations(base_dir), count_activations(app_dir)) == (2, 2)
+
+def test_initialize_all_async_starts_saved_active_extensions(registry, make_extension, monkeypatch):
+    alpha_dir = make_extension("alpha")
+    registry.discover()
+    registry.enable_extension("alpha")
+    
+    restarted = _restart(registry, monkeypatch)
+    results = asyncio.run(restarted.initialize_all_async())
+    
+    assert results["alpha"][0]
+    assert count_activations(alpha_dir) == 2
+
+def test_initialize_all_skips_extensions_whose_dependency_failed(registry, make_extension, monkeypatch):
+    app_dir = make_extension("app", dependencies=["base"])
+    make_extension("base")
+    registry.discover()
+    registry.enable_extension("app")
+    
+    restarted = _restart(registry, monkeypatch)
+    restarted.discover()
+    restarted.instances["base"].activate = lambda: False
+    results = restarted.initialize_all()
+    
+    assert results["base"] == (False, "Failed to activate extension base")
+    assert results["app"] == (False, "Extension app was not started because its dependencies failed: base")
+    assert restarted.extensions["base"].status == "error"
+    assert count_activations(app_dir) == 1